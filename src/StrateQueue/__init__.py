@@ -34,6 +34,8 @@ Usage:
 __version__ = "0.0.1"
 __author__ = "Trading System Contributors"
 
+import importlib
+
 # Data Provider Factory imports - new standardized interface
 from .core.signal_extractor import (
     LiveSignalExtractor,
@@ -43,13 +45,10 @@ from .core.signal_extractor import (
 )
 from .data import (
     BaseDataIngestion,
-    CoinMarketCapDataIngestion,
     DataProviderConfig,
     DataProviderFactory,
     DataProviderInfo,
     MarketData,
-    PolygonDataIngestion,
-    TestDataIngestion,
     auto_create_provider,
     detect_provider_type,
     get_supported_providers,
@@ -100,6 +99,21 @@ from .core.strategy_loader import StrategyLoader
 from .live_system import LiveTradingSystem
 from .multi_strategy import MultiStrategyRunner
 
+# Data provider classes load on first access (see data.sources.__getattr__)
+_LAZY_DATA_PROVIDERS = frozenset({
+    "PolygonDataIngestion",
+    "CoinMarketCapDataIngestion",
+    "TestDataIngestion",
+})
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_DATA_PROVIDERS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(".data.sources", __name__), name)
+    globals()[name] = value
+    return value
+
 __all__ = [
     # Data Provider Factory - new standardized interface
     "DataProviderFactory",
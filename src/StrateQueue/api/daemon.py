@@ -20,12 +20,16 @@ import subprocess
 import asyncio
 from asyncio.subprocess import PIPE, STDOUT
 import uuid
+import os
 import re
 import json
 import logging
 import signal
+import functools
+import tempfile
 from datetime import datetime, timezone
 from fastapi import Body
+from ..utils.price_formatter import PriceFormatter
 import socket, contextlib, httpx  # new imports for stats
 
 CRED_FILE = Path.home() / ".stratequeue" / "credentials.env"
@@ -43,10 +47,19 @@ app.add_middleware(
 
 
 # ───────────────────────── helpers ─────────────────────────
+# Parsed credentials keyed on (path, mtime_ns, size); the Web UI polls /config
+_env_cache: dict[str, Any] = {"key": None, "kv": {}}
+
+
 def _read_env() -> dict[str, str]:
     """Read environment variables from credentials file."""
     if not CRED_FILE.exists():
         return {}
+
+    st = CRED_FILE.stat()
+    key = (CRED_FILE, st.st_mtime_ns, st.st_size)
+    if _env_cache["key"] == key:
+        return dict(_env_cache["kv"])
     
     kv = {}
     for line in CRED_FILE.read_text().splitlines():
@@ -54,7 +67,8 @@ def _read_env() -> dict[str, str]:
         if line and not line.startswith("#") and "=" in line:
             k, v = line.split("=", 1)
             kv[k.strip()] = v.strip()
-    return kv
+    _env_cache["key"], _env_cache["kv"] = key, kv
+    return dict(kv)
 
 
 def _write_env(new: dict[str, str]) -> None:
@@ -65,7 +79,22 @@ def _write_env(new: dict[str, str]) -> None:
     CRED_FILE.parent.mkdir(exist_ok=True)
     body = ["# StrateQueue Credentials", "# Generated by daemon", ""]
     body += [f"{k}={v}" for k, v in env.items()]
-    CRED_FILE.write_text("\n".join(body) + "\n")
+    # Write a uniquely named sibling temp file (created 0600) and rename it
+    # over the original, so concurrent saves never share a temp file and a
+    # reader (or a crash mid-write) never sees a truncated credentials file
+    fd, tmp_path = tempfile.mkstemp(dir=CRED_FILE.parent, prefix=".credentials.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as fout:
+            fout.write("\n".join(body) + "\n")
+            fout.flush()
+            os.fsync(fout.fileno())
+        os.replace(tmp_path, CRED_FILE)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+    # Don't trust mtime alone after our own write (coarse timestamps, same size)
+    _env_cache["key"] = None
 
 
 # ──────────────────────── models ───────────────────────────
@@ -161,21 +190,30 @@ def save_config(payload: Dict[str, str]):
 async def upload_strategy(file: UploadFile = File(...)):
     """Save uploaded strategy file to a temp directory and return its path."""
     try:
-        import tempfile, shutil
+        import shutil
         dest_dir = Path.home() / ".stratequeue" / "uploaded_strategies"
-        dest_dir.mkdir(parents=True, exist_ok=True)
         
         # Use original filename, but handle conflicts by adding a number
         original_name = Path(file.filename).name if file.filename else "strategy.py"
-        dest_path = dest_dir / original_name
-        
+
+        # Scan the upload directory once instead of stat()-ing every candidate;
+        # it only needs creating on the first upload, so mkdir lazily
+        try:
+            with os.scandir(dest_dir) as entries:
+                taken = {entry.name for entry in entries}
+        except FileNotFoundError:
+            dest_dir.mkdir(parents=True, exist_ok=True)
+            taken = set()
+
         # If file exists, add a number suffix
+        dest_name = original_name
+        stem = Path(original_name).stem
+        suffix = Path(original_name).suffix or ".py"
         counter = 1
-        while dest_path.exists():
-            stem = Path(original_name).stem
-            suffix = Path(original_name).suffix or ".py"
-            dest_path = dest_dir / f"{stem}_{counter}{suffix}"
+        while dest_name in taken:
+            dest_name = f"{stem}_{counter}{suffix}"
             counter += 1
+        dest_path = dest_dir / dest_name
         
         # Save the file
         with dest_path.open("wb") as fout:
@@ -197,14 +235,35 @@ TRADE_RE = re.compile(r"(BUY|SELL).*@\s*([-+]?\d+\.\d+)")
 
 log = logging.getLogger(__name__)
 
+# Deploy payload → CLI flag tables used when spawning a strategy process
+_OPTIONAL_DEPLOY_FLAGS = (
+    ("strategy_id", "--strategy-id"),
+    ("allocation", "--allocation"),
+    ("broker", "--broker"),
+    ("engine", "--engine"),
+)
+_MODE_FLAGS = {"paper": "--paper", "live": "--live"}
+
+@functools.cache
+def _stats_client() -> httpx.Client:
+    """Shared HTTP client for polling per-strategy stats servers (keeps connections alive)."""
+    return httpx.Client()
+
 async def monitor_strategy_output(job_id: str, proc: subprocess.Popen):
     """Background task to read CLI output and update strategy metadata."""
     try:
         while proc.returncode is None:
-            line = await proc.stdout.readline()
-            if not line:  # EOF
-                await asyncio.sleep(0.1)
+            try:
+                line = await proc.stdout.readline()
+            except ValueError:
+                # A line longer than the stream limit (64 KiB); readline() has
+                # already discarded it. Keep reading so the pipe never fills up
+                # and blocks the strategy process.
+                log.debug(f"Strategy {job_id}: skipped oversized output line")
                 continue
+            if not line:  # EOF: wait for the exit notification instead of polling
+                await proc.wait()
+                break
 
             line = line.decode(errors='ignore').strip()
             if not line:
@@ -227,7 +286,6 @@ async def monitor_strategy_output(job_id: str, proc: subprocess.Popen):
                     price = float(trade_match.group(2))
                     meta["last_signal"] = datetime.now(timezone.utc).isoformat()
                     meta["last_signal_type"] = trade_type
-                    from ..utils.price_formatter import PriceFormatter
                     log.info(f"Strategy {job_id}: {trade_type} @ {PriceFormatter.format_price_for_logging(price)}")
                     
     except Exception as e:
@@ -262,22 +320,13 @@ async def start_deploy(payload: Dict[str, Any]):
         "--stats-port", str(stats_port),
     ]
 
-    if payload.get("strategy_id"):
-        cmd += ["--strategy-id", str(payload["strategy_id"])]
-    if payload.get("allocation"):
-        cmd += ["--allocation", str(payload["allocation"])]
-    if payload.get("broker"):
-        cmd += ["--broker", payload["broker"]]
-    if payload.get("engine"):
-        cmd += ["--engine", payload["engine"]]
+    for key, flag in _OPTIONAL_DEPLOY_FLAGS:
+        value = payload.get(key)
+        if value:
+            cmd += [flag, str(value)]
 
     mode = payload.get("mode", "signals")
-    if mode == "paper":
-        cmd.append("--paper")
-    elif mode == "live":
-        cmd.append("--live")
-    else:
-        cmd.append("--no-trading")
+    cmd.append(_MODE_FLAGS.get(mode, "--no-trading"))
 
     # ---------------------------------------------------------------
     job_id = str(uuid.uuid4())
@@ -349,21 +398,21 @@ async def get_strategies():
 async def get_strategy_details(strategy_id: str):
     """Get detailed information about a specific strategy."""
     try:
-        # Check if strategy exists in running systems
-        if strategy_id in running_systems:
-            strategy_info = running_systems[strategy_id]
-            proc = strategy_info["proc"]
-            meta = strategy_info["meta"]
-            
-            # Update process status
-            if proc.returncode is None:
-                meta["status"] = "running"
-            else:
-                meta["status"] = "finished"
-            
-            return meta
-        else:
+        # Single lookup: existence check and fetch in one step
+        strategy_info = running_systems.get(strategy_id)
+        if strategy_info is None:
             raise HTTPException(status_code=404, detail="Strategy not found")
+
+        proc = strategy_info["proc"]
+        meta = strategy_info["meta"]
+
+        # Update process status
+        if proc.returncode is None:
+            meta["status"] = "running"
+        else:
+            meta["status"] = "finished"
+
+        return meta
     except Exception as e:
         raise HTTPException(status_code=404, detail=f"Strategy not found: {e}")
 
@@ -372,17 +421,19 @@ async def get_strategy_details(strategy_id: str):
 async def get_strategy_statistics(strategy_id: str):
     """Get basic statistics for a specific strategy."""
     try:
-        if strategy_id not in running_systems:
+        strategy_info = running_systems.get(strategy_id)
+        if strategy_info is None:
             raise HTTPException(status_code=404, detail="Strategy not found")
-        
-        strategy_info = running_systems[strategy_id]
+
         meta = strategy_info["meta"]
         
         stats_url = meta.get("stats_url")
         stats_data = None
         if stats_url:
             try:
-                resp = httpx.get(stats_url, timeout=2.0)
+                # Blocking call: run it on the loop's bounded worker pool so a slow
+                # stats server can't stall every other request on the event loop
+                resp = await asyncio.to_thread(_stats_client().get, stats_url, timeout=2.0)
                 if resp.status_code == 200:
                     stats_data = resp.json()
             except Exception as e:
@@ -422,7 +473,8 @@ async def resume_strategy(strategy_id: str):
 async def stop_strategy(strategy_id: str, opts: dict = Body(default={})):
     """Stop a running strategy."""
     try:
-        if strategy_id not in running_systems:
+        entry = running_systems.get(strategy_id)
+        if entry is None:
             raise HTTPException(status_code=404, detail="Strategy not found")
 
         liquidate = bool(opts.get("liquidate", False))
@@ -430,7 +482,6 @@ async def stop_strategy(strategy_id: str, opts: dict = Body(default={})):
         
         GRACE_SECONDS = 5
 
-        entry = running_systems[strategy_id]
         proc = entry["proc"]
         
         # Mark as stopping
@@ -52,6 +52,39 @@ from ..broker_base import (
 )
 from ...utils.crypto_pairs import ALPACA_CRYPTO_SYMBOLS, to_alpaca_pair
 
+# Order-routing constants, built once rather than on every order
+_TIME_IN_FORCE_NAMES = frozenset({"day", "gtc", "ioc", "fok", "opg", "cls"})
+_CRYPTO_TIME_IN_FORCE = frozenset({"gtc", "ioc"})  # Alpaca only allows these for crypto
+_ALPACA_CRYPTO_PAIRS = frozenset({
+    "BTCUSD", "ETHUSD", "DOGEUSD", "LTCUSD", "BCHUSD", "ADAUSD", "DOTUSD", "UNIUSD", "LINKUSD", "SOLUSD",
+})
+
+
+# Signal groupings keyed by value, so SignalType members from a re-imported
+# module still match; used to pick the order side and request type
+_BUY_SIGNAL_VALUES = frozenset(
+    t.value for t in (SignalType.BUY, SignalType.LIMIT_BUY, SignalType.STOP_BUY, SignalType.STOP_LIMIT_BUY)
+)
+_ORDER_KIND_BY_SIGNAL = {
+    SignalType.BUY.value: "market",
+    SignalType.SELL.value: "market",
+    SignalType.CLOSE.value: "market",
+    SignalType.LIMIT_BUY.value: "limit",
+    SignalType.LIMIT_SELL.value: "limit",
+    SignalType.STOP_BUY.value: "stop",
+    SignalType.STOP_SELL.value: "stop",
+    SignalType.STOP_LIMIT_BUY.value: "stop_limit",
+    SignalType.STOP_LIMIT_SELL.value: "stop_limit",
+    SignalType.TRAILING_STOP_SELL.value: "trailing_stop",
+}
+
+def _time_in_force(time_in_force_enum, value: str, default: str):
+    """Map a time-in-force string onto Alpaca's TimeInForce, falling back to *default*."""
+    name = value.lower()
+    if name not in _TIME_IN_FORCE_NAMES:
+        name = default
+    return getattr(time_in_force_enum, name.upper())
+
 # Define Alpaca-specific components inline since legacy code was removed
 if ALPACA_AVAILABLE:
     # Inline AlpacaConfig and PositionSizeConfig since legacy code removed
@@ -498,30 +531,20 @@ class AlpacaBroker(BaseBroker):
             take_profit = metadata.get("take_profit")
             stop_loss = metadata.get("stop_loss")
 
-            # Map time in force
-            tif_map = {
-                "day": TimeInForce.DAY,
-                "gtc": TimeInForce.GTC,
-                "ioc": TimeInForce.IOC,
-                "fok": TimeInForce.FOK,
-                "opg": TimeInForce.OPG,
-                "cls": TimeInForce.CLS,
-            }
-
             # Override for crypto
             is_crypto = "/" in alpaca_symbol
             if is_crypto:
                 logger.debug(f"🔍 Crypto order (place_order) - time_in_force_str: '{time_in_force_str}'")
                 # For crypto orders, only allow gtc or ioc (Alpaca requirement)
-                if time_in_force_str.lower() in ["gtc", "ioc"]:
-                    time_in_force = tif_map.get(time_in_force_str.lower(), TimeInForce.GTC)
+                if time_in_force_str.lower() in _CRYPTO_TIME_IN_FORCE:
+                    time_in_force = _time_in_force(TimeInForce, time_in_force_str, "gtc")
                     logger.debug(f"✅ Using time_in_force_str: {time_in_force}")
                 else:
                     time_in_force = TimeInForce.GTC
                     logger.debug(f"⚠️ Invalid crypto time_in_force_str '{time_in_force_str}', defaulting to GTC")
                 extended_hours = False  # Not applicable for crypto
             else:
-                time_in_force = tif_map.get(time_in_force_str.lower(), TimeInForce.DAY)
+                time_in_force = _time_in_force(TimeInForce, time_in_force_str, "day")
 
             # Base parameters for all order types
             base_params = {
@@ -811,46 +834,27 @@ class AlpacaBroker(BaseBroker):
 
                 logger.info(f"💰 Position size calculated by {self.position_sizer.strategy.__class__.__name__}: ${position_size:.2f}")
 
-            # Determine order side
-            buy_signal_types = [
-                SignalType.BUY,
-                SignalType.LIMIT_BUY,
-                SignalType.STOP_BUY,
-                SignalType.STOP_LIMIT_BUY,
-            ]
-            
-            # Handle enum comparison issues by checking both object and value
-            is_buy_signal = (signal.signal in buy_signal_types or 
-                           (hasattr(signal.signal, 'value') and 
-                            signal.signal.value in [sig.value for sig in buy_signal_types]))
+            # Determine order side. Compare by value to handle enum comparison
+            # issues (e.g. SignalType imported through a different module path)
+            signal_value = getattr(signal.signal, 'value', signal.signal)
+            is_buy_signal = signal_value in _BUY_SIGNAL_VALUES
             side = OrderSide.BUY if is_buy_signal else OrderSide.SELL
 
-            # Map time in force from signal
-            tif_map = {
-                "day": TimeInForce.DAY,
-                "gtc": TimeInForce.GTC,
-                "ioc": TimeInForce.IOC,
-                "fok": TimeInForce.FOK,
-                "opg": TimeInForce.OPG,
-                "cls": TimeInForce.CLS,
-            }
-
             # Determine if crypto and extended-hours settings
             # Crypto pairs can have "/" like "ETH/USD" or be in Alpaca format like "ETHUSD", "DOGEUSD"
-            crypto_symbols = ["BTCUSD", "ETHUSD", "DOGEUSD", "LTCUSD", "BCHUSD", "ADAUSD", "DOTUSD", "UNIUSD", "LINKUSD", "SOLUSD"]
-            is_crypto = "/" in symbol or symbol in crypto_symbols
+            is_crypto = "/" in symbol or symbol in _ALPACA_CRYPTO_PAIRS
             
             # For crypto orders, only allow gtc or ioc (Alpaca requirement)
             if is_crypto:
                 logger.debug(f"🔍 Crypto order - signal time_in_force: '{signal.time_in_force}'")
-                if signal.time_in_force.lower() in ["gtc", "ioc"]:
-                    time_in_force = tif_map.get(signal.time_in_force.lower(), TimeInForce.GTC)
+                if signal.time_in_force.lower() in _CRYPTO_TIME_IN_FORCE:
+                    time_in_force = _time_in_force(TimeInForce, signal.time_in_force, "gtc")
                     logger.debug(f"✅ Using signal time_in_force: {time_in_force}")
                 else:
                     time_in_force = TimeInForce.GTC
                     logger.debug(f"⚠️ Invalid crypto time_in_force '{signal.time_in_force}', defaulting to GTC")
             else:
-                time_in_force = tif_map.get(signal.time_in_force.lower(), TimeInForce.DAY)
+                time_in_force = _time_in_force(TimeInForce, signal.time_in_force, "day")
             
             # Strategy passes extended-hours in metadata: {'extended_hours': True}
             extended_hours = (signal.metadata or {}).get("extended_hours", False) and not is_crypto
@@ -890,8 +894,7 @@ class AlpacaBroker(BaseBroker):
             notional_amount = None
 
             if is_buy_signal:
-                if is_crypto and (signal.signal == SignalType.BUY or 
-                                 (hasattr(signal.signal, 'value') and signal.signal.value == SignalType.BUY.value)):
+                if is_crypto and signal_value == SignalType.BUY.value:
                     # For crypto market buys, use notional amount (USD value)
                     # Ensure minimum order amount for Alpaca crypto orders ($10)
                     # If position_size is very small or invalid, use a reasonable default
@@ -960,13 +963,9 @@ class AlpacaBroker(BaseBroker):
                     base_params["time_in_force"] = TimeInForce.DAY
 
             # Create order request based on signal type
-            # Helper function to check signal type with enum comparison fix
-            def signal_matches(signal_types):
-                return (signal.signal in signal_types or 
-                       (hasattr(signal.signal, 'value') and 
-                        signal.signal.value in [sig.value for sig in signal_types]))
-            
-            if signal_matches([SignalType.BUY, SignalType.SELL, SignalType.CLOSE]):
+            order_kind = _ORDER_KIND_BY_SIGNAL.get(signal_value)
+
+            if order_kind == "market":
                 # For market orders, only pass the essential parameters
                 market_params = {
                     "symbol": base_params["symbol"],
@@ -987,20 +986,20 @@ class AlpacaBroker(BaseBroker):
                 
                 order_request = MarketOrderRequest(**market_params)
 
-            elif signal_matches([SignalType.LIMIT_BUY, SignalType.LIMIT_SELL]):
+            elif order_kind == "limit":
                 base_params["limit_price"] = signal.limit_price or signal.price
                 order_request = LimitOrderRequest(**base_params)
 
-            elif signal_matches([SignalType.STOP_BUY, SignalType.STOP_SELL]):
+            elif order_kind == "stop":
                 base_params["stop_price"] = signal.stop_price or signal.price
                 order_request = StopOrderRequest(**base_params)
 
-            elif signal_matches([SignalType.STOP_LIMIT_BUY, SignalType.STOP_LIMIT_SELL]):
+            elif order_kind == "stop_limit":
                 base_params["stop_price"] = signal.stop_price
                 base_params["limit_price"] = signal.limit_price or signal.price
                 order_request = StopLimitOrderRequest(**base_params)
 
-            elif signal_matches([SignalType.TRAILING_STOP_SELL]):
+            elif order_kind == "trailing_stop":
                 if signal.trail_percent:
                     base_params["trail_percent"] = signal.trail_percent
                 elif signal.trail_price:
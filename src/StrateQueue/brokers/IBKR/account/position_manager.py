@@ -5,6 +5,7 @@ Handles position information retrieval and management.
 """
 
 import logging
+import time
 from typing import Any, Dict, List, Optional
 
 try:
@@ -20,6 +21,12 @@ from ...broker_base import Position
 
 logger = logging.getLogger(__name__)
 
+# IB order states that mean a close order was accepted
+_CLOSE_ACCEPTED_STATUSES = frozenset({'Submitted', 'PreSubmitted', 'Filled'})
+
+# How long close_all_positions waits for its orders to leave PendingSubmit
+_CLOSE_SUBMIT_TIMEOUT = 5.0
+
 
 class PositionManager:
     """
@@ -274,38 +281,15 @@ class PositionManager:
                 self.logger.warning(f"No position to close for {symbol}")
                 return False
             
-            # Import here to avoid circular dependency
-            from ..contracts import create_contract
-            from ...broker_base import OrderSide, OrderType
-            
-            # Create contract
-            contract = create_contract(symbol)
-            
-            # Determine order side (opposite of position)
-            side = OrderSide.SELL if position.quantity > 0 else OrderSide.BUY
-            quantity = abs(position.quantity)
-            
-            # Place market order to close
-            from ib_insync import Order
-            close_order = Order(
-                action=side.value,
-                totalQuantity=quantity,
-                orderType='MKT'
-            )
-            
-            trade = self.ib.placeOrder(contract, close_order)
+            trade = self._place_close_order(symbol, position)
             
             # Wait for order to be submitted
             self.ib.waitOnUpdate()
             
-            success = trade.orderStatus.status in ['Submitted', 'PreSubmitted', 'Filled']
-            
+            success = self._close_order_accepted(symbol, position, trade)
             if success:
-                self.logger.info(f"Close order placed for {symbol}: {side.value} {quantity}")
                 # Invalidate cache since position will change
                 self.invalidate_cache()
-            else:
-                self.logger.error(f"Failed to place close order for {symbol}: {trade.orderStatus.status}")
             
             return success
             
@@ -317,6 +301,11 @@ class PositionManager:
         """
         Close all open positions
         
+        All close orders are placed before waiting on IB, rather than
+        waiting (and refetching positions) once per symbol. A symbol whose
+        order cannot be placed is logged and counted as a failure without
+        stopping the remaining closes.
+        
         Returns:
             True if all close orders were placed successfully
         """
@@ -327,10 +316,20 @@ class PositionManager:
                 self.logger.info("No positions to close")
                 return True
             
-            success_count = 0
-            for symbol in positions.keys():
-                if self.close_position(symbol):
-                    success_count += 1
+            trades = {}
+            for symbol, position in positions.items():
+                try:
+                    trades[symbol] = self._place_close_order(symbol, position)
+                except Exception as e:
+                    self.logger.error(f"Error closing position for {symbol}: {e}")
+            
+            self._wait_for_submission(trades.values())
+            self.invalidate_cache()
+            
+            success_count = sum(
+                self._close_order_accepted(symbol, positions[symbol], trade)
+                for symbol, trade in trades.items()
+            )
             
             self.logger.info(f"Requested close for {success_count}/{len(positions)} positions")
             return success_count == len(positions)
@@ -339,6 +338,43 @@ class PositionManager:
             self.logger.error(f"Error closing all positions: {e}")
             return False
     
+    def _wait_for_submission(self, trades, timeout: float = _CLOSE_SUBMIT_TIMEOUT) -> None:
+        """Wait on IB updates until no trade is PendingSubmit or *timeout* elapses"""
+        deadline = time.monotonic() + timeout
+        while any(trade.orderStatus.status == 'PendingSubmit' for trade in trades):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            self.ib.waitOnUpdate(timeout=remaining)
+    
+    def _place_close_order(self, symbol: str, position: Position):
+        """Place a market order that flattens *position* and return the IB trade"""
+        # Import here to avoid circular dependency
+        from ..contracts import create_contract
+        from ...broker_base import OrderSide
+        from ib_insync import Order
+        
+        # Determine order side (opposite of position)
+        side = OrderSide.SELL if position.quantity > 0 else OrderSide.BUY
+        close_order = Order(
+            action=side.value,
+            totalQuantity=abs(position.quantity),
+            orderType='MKT'
+        )
+        
+        return self.ib.placeOrder(create_contract(symbol), close_order)
+    
+    def _close_order_accepted(self, symbol: str, position: Position, trade) -> bool:
+        """Log and report whether IB accepted a close order"""
+        status = trade.orderStatus.status
+        if status in _CLOSE_ACCEPTED_STATUSES:
+            side = "SELL" if position.quantity > 0 else "BUY"
+            self.logger.info(f"Close order placed for {symbol}: {side} {abs(position.quantity)}")
+            return True
+        
+        self.logger.error(f"Failed to place close order for {symbol}: {status}")
+        return False
+    
     def get_portfolio_summary(self) -> Dict[str, Any]:
         """
         Get portfolio summary statistics
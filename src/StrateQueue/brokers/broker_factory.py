@@ -16,6 +16,20 @@ from .broker_helpers import (
 
 logger = logging.getLogger(__name__)
 
+# Broker aliases mapped to canonical names; built once instead of per lookup
+_BROKER_ALIASES = {
+    'ibkr': 'ibkr',
+    'IBKR': 'ibkr',
+    'interactive-brokers': 'ibkr',
+    'interactive_brokers': 'ibkr',
+    'alpaca': 'alpaca',
+    'ib_gateway': 'ib_gateway',
+    'ibkr_gateway': 'ib_gateway',
+    'ib-gateway': 'ib_gateway',
+    'gateway': 'ib_gateway',
+    'ccxt': 'ccxt',
+}
+
 
 class BrokerFactory:
     """Factory for creating trading broker instances"""
@@ -34,21 +48,7 @@ class BrokerFactory:
         Returns:
             Canonical broker type name
         """
-        # Map aliases to canonical names
-        alias_map = {
-            'ibkr': 'ibkr',
-            'IBKR': 'ibkr', 
-            'interactive-brokers': 'ibkr',
-            'interactive_brokers': 'ibkr',
-            'alpaca': 'alpaca',
-            'ib_gateway': 'ib_gateway',
-            'ibkr_gateway': 'ib_gateway',
-            'ib-gateway': 'ib_gateway',
-            'gateway': 'ib_gateway',
-            'ccxt': 'ccxt',
-        }
-        
-        return alias_map.get(broker_type, broker_type)
+        return _BROKER_ALIASES.get(broker_type, broker_type)
 
     @classmethod
     def _initialize_brokers(cls):
@@ -6,6 +6,7 @@ This replaces the monolithic cli.py with a clean, modular approach.
 """
 
 import argparse
+import functools
 import os
 import sys
 from pathlib import Path
@@ -16,7 +17,7 @@ from dotenv import load_dotenv
 load_dotenv()  # Load from current directory
 load_dotenv(Path.home() / ".stratequeue" / "credentials.env")  # Load user credentials
 
-from .command_factory import create_command, get_supported_commands
+from .command_factory import CommandFactory, create_command, get_supported_commands
 from .utils import get_cli_logger, setup_logging
 from .utils.color_formatter import (
     create_enhanced_help_epilog,
@@ -24,7 +25,7 @@ from .utils.color_formatter import (
     format_welcome_message,
 )
 from .utils.command_help import get_command_help
-from .utils.enhanced_parser import EnhancedArgumentParser
+from .utils.enhanced_parser import EnhancedHelpFormatter
 
 # Import command registry to ensure commands are registered
 from . import command_registry  # noqa: F401
@@ -35,21 +36,47 @@ logger = get_cli_logger('main')
 # Stub loading is now handled in test fixtures
 
 
-def create_main_parser() -> argparse.ArgumentParser:
+def create_main_parser(argv: list[str] | None = None) -> argparse.ArgumentParser:
     """
     Create the main argument parser with subcommands
 
+    Parsers are cached per selected command and registered command set, so
+    repeated invocations within one process (REPLs, test harnesses) reuse
+    them while commands registered later still show up. parse_args() does
+    not modify the parser, and command setup_parser() hooks must only add
+    arguments for this to hold.
+
+    Args:
+        argv: Command line arguments; when they name a command, only that
+            command's subparser is built
+
     Returns:
         Configured ArgumentParser
     """
-    # Get supported commands for enhanced help
-    supported_commands = get_supported_commands()
+    supported_commands = tuple(get_supported_commands().items())
+    return _build_main_parser(_find_selected_command(argv), supported_commands)
+
 
+@functools.lru_cache(maxsize=16)
+def _build_main_parser(
+    selected: str | None, supported_commands: tuple[tuple[str, str], ...]
+) -> argparse.ArgumentParser:
+    """
+    Build the main parser, registering only ``selected`` when given
+
+    Args:
+        selected: Command name or alias found in argv, or None
+        supported_commands: (name, description) pairs of the registered
+            commands; part of the cache key so the help epilog stays current
+
+    Returns:
+        Configured ArgumentParser
+    """
     parser = argparse.ArgumentParser(
         prog='stratequeue',
         description=format_help_header(),
         formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-        epilog=create_enhanced_help_epilog(supported_commands)
+        epilog=create_enhanced_help_epilog(dict(supported_commands))
     )
 
     # Global arguments
@@ -75,17 +102,45 @@ def create_main_parser() -> argparse.ArgumentParser:
     )
 
     # Register command parsers
-    register_command_parsers(subparsers)
+    register_command_parsers(subparsers, selected)
 
     return parser
 
 
-def register_command_parsers(subparsers) -> None:
+# Global options that consume the following argv token as their value
+_GLOBAL_OPTIONS_WITH_VALUE = frozenset({'--verbose', '-v'})
+
+
+def _find_selected_command(argv: list[str] | None) -> str | None:
+    """
+    Peek at the command position of argv (the first non-option token)
+
+    Args:
+        argv: Command line arguments (may be None)
+
+    Returns:
+        Command name/alias as typed, or None if no command was given or the
+        token is not a registered command (so the full parser reports it)
     """
-    Register parsers for all available commands
+    if not argv:
+        return None
+    tokens = iter(argv)
+    for token in tokens:
+        if token in _GLOBAL_OPTIONS_WITH_VALUE:
+            next(tokens, None)
+        elif not token.startswith('-'):
+            return token if CommandFactory.command_exists(token) else None
+    return None
+
+
+def register_command_parsers(subparsers, selected: str | None = None) -> None:
+    """
+    Register parsers for available commands
 
     Args:
         subparsers: Subparsers object to add command parsers to
+        selected: Command name or alias to register exclusively; when None,
+            every command is registered (needed for top-level help and errors)
     """
     supported_commands = get_supported_commands()
 
@@ -102,6 +157,10 @@ def register_command_parsers(subparsers) -> None:
                 elif aliases_attr is not None:
                     aliases = [aliases_attr] if isinstance(aliases_attr, str) else []
 
+            # Skip building help and arguments for commands that weren't invoked
+            if selected is not None and selected != command_name and selected not in aliases:
+                continue
+
             # Get enhanced help content
             enhanced_help = get_command_help(command_name)
 
@@ -113,7 +172,7 @@ def register_command_parsers(subparsers) -> None:
                 help=argparse.SUPPRESS,  # Hide from auto-generated list
                 description=enhanced_help['description'],
                 epilog=enhanced_help['epilog'],
-                formatter_class=EnhancedArgumentParser().formatter_class
+                formatter_class=EnhancedHelpFormatter
             )
 
             # Let the command configure its parser
@@ -143,7 +202,9 @@ def main(argv: list[str] | None = None) -> int:
     
     try:
         # Parse arguments
-        parser = create_main_parser()
+        if argv is None:
+            argv = sys.argv[1:]
+        parser = create_main_parser(argv)
         args = parser.parse_args(argv)
 
         # Setup logging
@@ -33,6 +33,11 @@ class CommandFactory:
         command_instance = command_class()
         command_name = command_instance.name
 
+        # Registering the same class again (e.g. module imported twice) is a no-op
+        if cls._registered_commands.get(command_name) is command_class:
+            logger.debug(f"Command '{command_name}' already registered, skipping")
+            return
+
         if command_name in cls._registered_commands:
             logger.warning(f"Command '{command_name}' already registered, overwriting")
 
@@ -8,6 +8,9 @@ Provides consistent interface and common functionality.
 import abc
 import argparse
 import logging
+from collections.abc import Iterable
+
+from ...utils.console import write_lines
 
 logger = logging.getLogger(__name__)
 
@@ -67,6 +70,16 @@ class BaseCommand(abc.ABC):
         """
         pass
 
+    @staticmethod
+    def _emit(lines: Iterable[str]) -> None:
+        """
+        Write a block of output lines to stdout in a single write
+
+        Args:
+            lines: Lines to print (without trailing newlines)
+        """
+        write_lines(lines)
+
     def validate_args(self, args: argparse.Namespace) -> list[str] | None:
         """
         Validate command arguments
@@ -6,17 +6,16 @@ including validation and trading system execution.
 
 import argparse
 import asyncio
+import contextlib
+import json
 import logging
 import math
-import numpy as np
 import os
-import random, threading, socket
+import threading, socket
+import time
 from argparse import Namespace
+from pathlib import Path
 
-from fastapi import FastAPI
-from fastapi.responses import JSONResponse
-from fastapi.encoders import jsonable_encoder
-from uvicorn import Config, Server
 from ..formatters.base_formatter import BaseFormatter
 from ..utils.deploy_utils import parse_symbols
 
@@ -25,14 +24,62 @@ from .base_command import BaseCommand
 
 logger = logging.getLogger(__name__)
 
+# /stats responses are reused for this long; the daemon and Web UI poll it
+# and each miss reruns the full equity-curve/risk computation
+_STATS_TTL_SECONDS = 1.0
+
+# /stats bodies are encoded once per TTL window; prefer orjson when installed
+try:
+    from orjson import dumps as _json_dumps
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode()
+
+_QUICK_HELP_LINES = (
+    "",
+    "💡 Quick Help:",
+    "  stratequeue list engines              # See supported engines",
+    "  stratequeue list brokers              # See supported brokers",
+    "  stratequeue status                    # Check broker credentials",
+    "  stratequeue setup broker <broker>     # Setup broker",
+    "  stratequeue deploy --help             # Detailed deployment help",
+    "",
+    "📖 Common Examples:",
+    "  # Test strategy (default mode)",
+    "  stratequeue deploy --strategy sma.py --symbol AAPL",
+    "",
+    "  # Paper trading (fake money)",
+    "  stratequeue deploy --strategy sma.py --symbol AAPL --paper",
+    "",
+    "  # Live trading (real money - be careful!)",
+    "  stratequeue deploy --strategy sma.py --symbol AAPL --live",
+)
+
 
 class DeployCommand(BaseCommand):
     """Deploy command for strategy execution"""
 
-    def __init__(self):
-        super().__init__()
-        self.validator = DeployValidator()
-        self.formatter = BaseFormatter()
+    # Validator and formatter hold no per-run state, so a single instance is
+    # shared by every DeployCommand (the CLI builds several per invocation).
+    # Both are created on first use, so runs of other commands never pay for them.
+    _shared_validator: DeployValidator | None = None
+    _shared_formatter: BaseFormatter | None = None
+
+    @property
+    def validator(self) -> DeployValidator:
+        """Shared deploy argument validator"""
+        cls = type(self)
+        if cls._shared_validator is None:
+            cls._shared_validator = DeployValidator()
+        return cls._shared_validator
+
+    @property
+    def formatter(self) -> BaseFormatter:
+        """Shared output formatter"""
+        cls = type(self)
+        if cls._shared_formatter is None:
+            cls._shared_formatter = BaseFormatter()
+        return cls._shared_formatter
 
     @property
     def name(self) -> str:
@@ -95,13 +142,6 @@ class DeployCommand(BaseCommand):
             help='Broker(s) for trading. Single value applies to all, or comma-separated list matching strategies (e.g., alpaca or alpaca,kraken)'
         )
 
-        # Get supported engines for autocomplete
-        try:
-            from ...engines import get_supported_engines
-            supported_engines = get_supported_engines()
-        except Exception:
-            supported_engines = None  # Fallback if import fails
-        
         parser.add_argument(
             '--engine',
             help='Trading engine to use (e.g., vectorbt, backtesting). If not specified, will auto-detect from strategy file'
@@ -173,6 +213,13 @@ class DeployCommand(BaseCommand):
         # Logging is already set up by the main CLI based on global --verbose flag
         # No need to set it up again here
 
+        # Validate arguments first so bad input fails before any backend is imported
+        is_valid, errors = self.validator.validate(args)
+        if not is_valid:
+            self._show_validation_errors(errors)
+            self._show_quick_help()
+            return 1
+
         # Validate engine availability if specified
         if hasattr(args, 'engine') and args.engine:
             engine_error = self._validate_engine(args.engine)
@@ -180,13 +227,6 @@ class DeployCommand(BaseCommand):
                 print(f"❌ Error: {engine_error}")
                 return 1
 
-        # Validate arguments
-        is_valid, errors = self.validator.validate(args)
-        if not is_valid:
-            self._show_validation_errors(errors)
-            self._show_quick_help()
-            return 1
-
         # Run the trading system normally
         try:
             return asyncio.run(self._run_trading_system(args))
@@ -200,8 +240,7 @@ class DeployCommand(BaseCommand):
 
     def _show_validation_errors(self, errors: list[str]) -> None:
         """Show validation errors to user"""
-        for error in errors:
-            print(f"❌ Error: {error}")
+        self._emit(f"❌ Error: {error}" for error in errors)
 
     def _validate_engine(self, engine_name: str) -> str | None:
         """
@@ -235,23 +274,7 @@ class DeployCommand(BaseCommand):
 
     def _show_quick_help(self) -> None:
         """Show quick help for common issues"""
-        print("")
-        print("💡 Quick Help:")
-        print("  stratequeue list engines              # See supported engines")
-        print("  stratequeue list brokers              # See supported brokers")
-        print("  stratequeue status                    # Check broker credentials")
-        print("  stratequeue setup broker <broker>     # Setup broker")
-        print("  stratequeue deploy --help             # Detailed deployment help")
-        print("")
-        print("📖 Common Examples:")
-        print("  # Test strategy (default mode)")
-        print("  stratequeue deploy --strategy sma.py --symbol AAPL")
-        print("")
-        print("  # Paper trading (fake money)")
-        print("  stratequeue deploy --strategy sma.py --symbol AAPL --paper")
-        print("")
-        print("  # Live trading (real money - be careful!)")
-        print("  stratequeue deploy --strategy sma.py --symbol AAPL --live")
+        self._emit(_QUICK_HELP_LINES)
 
     async def _run_trading_system(self, args: Namespace) -> int:
         """
@@ -264,11 +287,11 @@ class DeployCommand(BaseCommand):
             Exit code
         """
         try:
-            # Import here to avoid circular imports
-            from ...live_system.orchestrator import LiveTradingSystem
+            # Resolve the orchestrator up front so missing dependencies surface here
+            _live_trading_system_class()
 
-            # Parse symbols
-            symbols = parse_symbols(args.symbol)
+            # Reuse symbols parsed during validation
+            symbols = args._symbols if hasattr(args, '_symbols') else parse_symbols(args.symbol)
 
             # Determine trading configuration
             enable_trading = args._enable_trading
@@ -298,7 +321,6 @@ class DeployCommand(BaseCommand):
         try:
             import tempfile
 
-            from ...live_system.orchestrator import LiveTradingSystem
             from ..utils.deploy_utils import create_inline_strategy_config
 
             # Create temporary multi-strategy config
@@ -308,59 +330,48 @@ class DeployCommand(BaseCommand):
                 print("❌ Failed to create multi-strategy configuration")
                 return 1
 
-            # Create temporary config file
-            temp_config = tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False)
-            try:
-                temp_config.write(temp_config_content)
-                temp_config.close()
+            # Create temporary config file (mkstemp keeps O_EXCL creation, and
+            # the plain path avoids a NamedTemporaryFile wrapper object)
+            fd, temp_config_path = tempfile.mkstemp(prefix='stratequeue_mscfg_', suffix='.csv')
+            with contextlib.ExitStack() as stack:
+                # Single teardown path; further resources can be pushed onto the stack
+                stack.callback(Path(temp_config_path).unlink, missing_ok=True)
+
+                with os.fdopen(fd, 'w') as temp_config:
+                    temp_config.write(temp_config_content)
 
                 logger.info("Created temporary multi-strategy configuration")
                 print("📊 Multi-strategy mode - temporary config created")
 
-                # Get allocation value for statistics (use first allocation for multi-strategy)
-                allocation_value = 0.0
-                if hasattr(args, '_allocations') and args._allocations:
-                    allocation_value = float(args._allocations[0])
-                    # If allocation is <= 1.0, treat as percentage of 100k initial capital
-                    if allocation_value <= 1.0:
-                        allocation_value = allocation_value * 100000.0
-                    # Otherwise, treat as dollar amount (e.g., 25000 = $25,000)
-
                 # Initialize multi-strategy system
+                LiveTradingSystem = _live_trading_system_class()
                 system = LiveTradingSystem(
                     symbols=symbols,
                     data_source=args._data_sources[0],
                     granularity=args._granularities[0] if args._granularities else "1m",
                     enable_trading=enable_trading,
-                    multi_strategy_config=temp_config.name,
+                    multi_strategy_config=temp_config_path,
                     broker_type=args._brokers[0] if args._brokers and args._brokers[0] != 'auto' else None,
                     paper_trading=paper_trading,
                     lookback_override=args.lookback,
-                    allocation=allocation_value
+                    # Statistics use the first allocation in multi-strategy mode
+                    allocation=_statistics_allocation(args)
                 )
 
-                print(f"🚀 Starting multi-strategy system for {args.duration} minutes...")
-                print(f"📈 Strategies: {len(args._strategies)}")
-                print(f"💰 Trading mode: {'Paper' if paper_trading else 'Live' if enable_trading else 'Signals only'}")
-                print("")
+                self._emit((
+                    f"🚀 Starting multi-strategy system for {args.duration} minutes...",
+                    f"📈 Strategies: {len(args._strategies)}",
+                    f"💰 Trading mode: {'Paper' if paper_trading else 'Live' if enable_trading else 'Signals only'}",
+                    "",
+                ))
 
-                # Start stats server
-                port = args.stats_port if getattr(args, 'stats_port', None) else 0
-                if not port:
-                    port = _find_free_port()
-                _start_stats_server(system.statistics_manager, port)
-                print(f"📡 Statistics server listening on 127.0.0.1:{port}/stats")
+                _serve_statistics(system.statistics_manager, args)
 
                 await system.run_live_system(args.duration)
 
                 print("✅ Multi-strategy system completed successfully")
                 return 0
 
-            finally:
-                # Clean up temporary file
-                if os.path.exists(temp_config.name):
-                    os.unlink(temp_config.name)
-
         except Exception as e:
             logger.error(f"Error running multi-strategy system: {e}")
             print(f"❌ Error running multi-strategy system: {e}")
@@ -370,8 +381,6 @@ class DeployCommand(BaseCommand):
                                          enable_trading: bool, paper_trading: bool) -> int:
         """Run single strategy system"""
         try:
-            from ...live_system.orchestrator import LiveTradingSystem
-
             strategy_path = args._strategies[0]
 
             # Get single values for single strategy
@@ -382,7 +391,7 @@ class DeployCommand(BaseCommand):
             # Configure position sizer based on allocation type
             position_sizer = None
             if hasattr(args, '_allocations') and args._allocations:
-                allocation_value = float(args._allocations[0])
+                allocation_value = _first_allocation_value(args)
                 if allocation_value > 1.0:
                     # Dollar allocation - use FixedDollarSizing
                     from ...core.position_sizer import FixedDollarSizing, PositionSizer
@@ -392,16 +401,8 @@ class DeployCommand(BaseCommand):
                     from ...core.position_sizer import PercentOfCapitalSizing, PositionSizer
                     position_sizer = PositionSizer(PercentOfCapitalSizing(allocation_value))
 
-            # Get allocation value for statistics
-            allocation_value = 0.0
-            if hasattr(args, '_allocations') and args._allocations:
-                allocation_value = float(args._allocations[0])
-                # If allocation is <= 1.0, treat as percentage of 100k initial capital
-                if allocation_value <= 1.0:
-                    allocation_value = allocation_value * 100000.0
-                # Otherwise, treat as dollar amount (e.g., 25000 = $25,000)
-
             # Initialize single strategy system
+            LiveTradingSystem = _live_trading_system_class()
             system = LiveTradingSystem(
                 strategy_path=strategy_path,
                 symbols=symbols,
@@ -413,21 +414,18 @@ class DeployCommand(BaseCommand):
                 lookback_override=args.lookback,
                 engine_type=getattr(args, 'engine', None),
                 position_sizer=position_sizer,
-                allocation=allocation_value
+                allocation=_statistics_allocation(args)
             )
 
-            print(f"🚀 Starting single strategy system for {args.duration} minutes...")
-            print(f"📊 Strategy: {os.path.basename(strategy_path)}")
-            print(f"💰 Trading mode: {'Paper' if paper_trading else 'Live' if enable_trading else 'Signals only'}")
-            print(f"📈 Symbols: {', '.join(symbols)}")
-            print("")
+            self._emit((
+                f"🚀 Starting single strategy system for {args.duration} minutes...",
+                f"📊 Strategy: {args._strategy_basename}",
+                f"💰 Trading mode: {'Paper' if paper_trading else 'Live' if enable_trading else 'Signals only'}",
+                f"📈 Symbols: {', '.join(symbols)}",
+                "",
+            ))
 
-            # Start stats server
-            port = args.stats_port if getattr(args, 'stats_port', None) else 0
-            if not port:
-                port = _find_free_port()
-            _start_stats_server(system.statistics_manager, port)
-            print(f"📡 Statistics server listening on 127.0.0.1:{port}/stats")
+            _serve_statistics(system.statistics_manager, args)
 
             await system.run_live_system(args.duration)
 
@@ -444,6 +442,41 @@ class DeployCommand(BaseCommand):
         print("❌ Daemon mode has been removed from StrateQueue. Please run strategies directly without the --daemon flag.")
         return 1
 
+# Helper: resolve the orchestrator lazily (pulls in pandas, brokers, engines)
+
+def _live_trading_system_class():
+    from ...live_system.orchestrator import LiveTradingSystem
+    return LiveTradingSystem
+
+# Helper: first allocation as a float, reusing the validator's parsed values
+
+def _first_allocation_value(args: Namespace) -> float:
+    values = getattr(args, '_allocation_values', None)
+    if values:
+        return values[0]
+    return float(args._allocations[0])
+
+# Helper: capital figure handed to statistics for the first allocation
+
+def _statistics_allocation(args: Namespace) -> float:
+    if not (hasattr(args, '_allocations') and args._allocations):
+        return 0.0
+    allocation_value = _first_allocation_value(args)
+    # If allocation is <= 1.0, treat as percentage of 100k initial capital;
+    # otherwise treat as dollar amount (e.g., 25000 = $25,000)
+    if allocation_value <= 1.0:
+        return allocation_value * 100000.0
+    return allocation_value
+
+# Helper: start the stats server on --stats-port, or any free port
+
+def _serve_statistics(stats_manager, args: Namespace) -> None:
+    port = args.stats_port if getattr(args, 'stats_port', None) else 0
+    if not port:
+        port = _find_free_port()
+    _start_stats_server(stats_manager, port)
+    print(f"📡 Statistics server listening on 127.0.0.1:{port}/stats")
+
 # Helper: find free TCP port
 
 def _find_free_port() -> int:
@@ -455,6 +488,11 @@ def _find_free_port() -> int:
 
 def _start_stats_server(stats_manager, port: int):
     """Expose statistics_manager.calc_summary_metrics() on /stats (JSON)."""
+    import numpy as np
+    from fastapi import FastAPI
+    from fastapi.responses import Response
+    from uvicorn import Config, Server
+
     app = FastAPI()
 
     # ------------------------------------------------------------------
@@ -474,14 +512,27 @@ def _start_stats_server(stats_manager, port: int):
             cleaned[k] = v
         return cleaned
 
+    # (monotonic timestamp, encoded JSON body) of the last computation
+    cached: list = [0.0, None]
+
     @app.get('/stats')
     async def get_stats():
         try:
-            raw = stats_manager.calc_summary_metrics()
-            safe = _sanitize_metrics(raw)
-            return JSONResponse(content=jsonable_encoder(safe))
+            now = time.monotonic()
+            if cached[1] is None or now - cached[0] >= _STATS_TTL_SECONDS:
+                raw = stats_manager.calc_summary_metrics()
+                # _sanitize_metrics already yields plain JSON types, so encode
+                # once here and serve the same bytes until the TTL lapses
+                cached[:] = [now, _json_dumps(_sanitize_metrics(raw))]
+            return Response(content=cached[1], media_type='application/json')
         except Exception as e:
-            return {'error': str(e)}
+            logger.error(f"Failed to compute statistics for /stats: {e}")
+            # Failures are never cached, so the next poll retries the computation
+            return Response(
+                content=_json_dumps({'error': str(e)}),
+                status_code=500,
+                media_type='application/json',
+            )
 
     cfg = Config(app, host='127.0.0.1', port=port, log_level='warning', loop='asyncio')
     thread = threading.Thread(target=Server(cfg).run, daemon=True)
@@ -6,6 +6,8 @@ This includes brokers, granularities, and strategies.
 """
 
 import argparse
+import functools
+from collections.abc import Callable
 
 from ..formatters.info_formatter import InfoFormatter
 from .base_command import BaseCommand
@@ -18,8 +20,13 @@ class ListCommand(BaseCommand):
     Handles listing of various system resources and options.
     """
 
-    def __init__(self):
-        super().__init__()
+    # list_type → InfoFormatter method; resolved at call time so the
+    # formatter can be swapped (or patched) without rebuilding the table
+    _FORMATTERS = {
+        "brokers": "format_broker_info",
+        "providers": "format_provider_info",
+        "engines": "format_engine_info",
+    }
 
     @property
     def name(self) -> str:
@@ -39,7 +46,7 @@ class ListCommand(BaseCommand):
         parser.add_argument(
             "list_type",
             nargs="?",
-            choices=["brokers", "providers", "engines"],
+            choices=list(self._FORMATTERS),
             help="Type of resource to list",
         )
 
@@ -60,36 +67,44 @@ class ListCommand(BaseCommand):
     def execute(self, args: argparse.Namespace) -> int:
         """Execute list command"""
 
-        if not hasattr(args, "list_type") or args.list_type is None:
+        list_type = getattr(args, "list_type", None)
+        if list_type is None:
             # No list type provided, show available options
             print(InfoFormatter.format_command_help())
             return 0
 
-        if args.list_type == "brokers":
-            print(InfoFormatter.format_broker_info())
-            return 0
+        formatter_name = self._FORMATTERS.get(list_type)
+        if formatter_name is None:
+            # This shouldn't happen due to choices constraint, but handle gracefully
+            print(InfoFormatter.format_error(f"Unknown list type: {list_type}"))
+            print(f"💡 Available options: {', '.join(self._FORMATTERS)}")
+            return 1
 
-        elif args.list_type == "providers":
-            print(InfoFormatter.format_provider_info())
-            return 0
+        print(self._cached_output(getattr(InfoFormatter, formatter_name)))
+        return 0
 
-        elif args.list_type == "engines":
-            print(InfoFormatter.format_engine_info())
-            return 0
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _cached_output(formatter: Callable[[], str]) -> str:
+        """
+        Render static formatter output once per process
 
-        else:
-            # This shouldn't happen due to choices constraint, but handle gracefully
-            print(InfoFormatter.format_error(f"Unknown list type: {args.list_type}"))
-            print("💡 Available options: brokers, providers, engines")
-            return 1
+        Keyed on the formatter callable itself, so repeated listings inside a
+        long-running process (daemon, Web UI) reuse the rendered text.
+        """
+        return formatter()
 
     # Deprecated methods retained for backward compatibility but not exposed
     def _list_strategies(self, args: argparse.Namespace) -> int:
         """This method is deprecated and retained for compatibility."""
-        print("⚠️  Strategy listing is no longer supported via CLI.")
-        return 0
+        return self._unsupported_listing("Strategy")
 
     def _list_engines(self, args: argparse.Namespace) -> int:
         """This method is deprecated and retained for compatibility."""
-        print("⚠️  Engine listing is no longer supported via CLI.")
+        return self._unsupported_listing("Engine")
+
+    @staticmethod
+    def _unsupported_listing(label: str) -> int:
+        """Shared body of the deprecated listing methods"""
+        print(f"⚠️  {label} listing is no longer supported via CLI.")
         return 0
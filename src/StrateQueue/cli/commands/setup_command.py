@@ -5,19 +5,47 @@ Command for configuring broker credentials and system settings.
 """
 
 import argparse
-from pathlib import Path
+import importlib.util
 import os
-
-try:
-    from questionary import password, select, text
-
-    QUESTIONARY_AVAILABLE = True
-except ImportError:
-    QUESTIONARY_AVAILABLE = False
+from pathlib import Path
 
 from ..formatters import InfoFormatter
 from .base_command import BaseCommand
 
+# questionary pulls in prompt_toolkit; only probe for it here and import on
+# first prompt so other commands don't pay for it at CLI startup
+QUESTIONARY_AVAILABLE = importlib.util.find_spec("questionary") is not None
+
+
+class _UnavailablePrompt:
+    """Stand-in for a questionary prompt when the import fails; ``ask`` cancels"""
+
+    def ask(self):
+        return None
+
+
+def _prompt(kind: str, *args, **kwargs):
+    try:
+        import questionary
+    except ImportError:
+        # Installed but broken (find_spec succeeded): report it like a missing package
+        print("❌ Interactive setup requires 'questionary' package.")
+        print("💡 Install with: pip install questionary")
+        return _UnavailablePrompt()
+    return getattr(questionary, kind)(*args, **kwargs)
+
+
+def select(*args, **kwargs):
+    return _prompt("select", *args, **kwargs)
+
+
+def text(*args, **kwargs):
+    return _prompt("text", *args, **kwargs)
+
+
+def password(*args, **kwargs):
+    return _prompt("password", *args, **kwargs)
+
 
 class SetupCommand(BaseCommand):
     """
@@ -26,6 +54,21 @@ class SetupCommand(BaseCommand):
     Provides interactive setup for brokers and system configuration.
     """
 
+    # Canonical broker -> (menu label, setup method name)
+    _BROKER_SETUPS = {
+        "alpaca": ("Alpaca (US stocks, ETFs, crypto)", "_setup_alpaca"),
+        "ibkr": ("Interactive Brokers (stocks, options, futures, forex)", "_setup_ibkr"),
+        "ccxt": ("CCXT (250+ cryptocurrency exchanges)", "_setup_ccxt"),
+    }
+    _IBKR_ALIASES = frozenset({"ibkr", "interactive-brokers", "interactive_brokers", "ib_gateway"})
+
+    # Data provider -> (menu label, setup method name); demo needs no credentials
+    _PROVIDER_SETUPS = {
+        "polygon": ("Polygon (stocks, crypto, forex - premium)", "_setup_polygon"),
+        "coinmarketcap": ("CoinMarketCap (cryptocurrency data)", "_setup_coinmarketcap"),
+        "ccxt": ("CCXT (250+ cryptocurrency exchanges)", "_setup_ccxt_data_provider"),
+    }
+
     @property
     def name(self) -> str:
         return "setup"
@@ -111,14 +154,7 @@ class SetupCommand(BaseCommand):
                 print("💡 Or use: stratequeue setup broker --docs")
                 return 1
 
-            broker_name = self._interactive_broker_setup()
-            if broker_name:
-                print(f"✅ {broker_name.capitalize()} credentials saved.")
-                print("💡 Test your setup with: stratequeue status")
-                return 0
-            else:
-                print("⚠️  Setup cancelled.")
-                return 130
+            return self._report_setup_result(self._interactive_broker_setup())
 
         elif setup_type == "data-provider":
             if not QUESTIONARY_AVAILABLE:
@@ -127,20 +163,31 @@ class SetupCommand(BaseCommand):
                 print("💡 Or use: stratequeue setup data-provider --docs")
                 return 1
 
-            provider_name = self._interactive_data_provider_setup()
-            if provider_name:
-                print(f"✅ {provider_name.capitalize()} credentials saved.")
-                print("💡 Test your setup with: stratequeue status")
-                return 0
-            else:
-                print("⚠️  Setup cancelled.")
-                return 130
+            return self._report_setup_result(self._interactive_data_provider_setup())
 
         else:
             print(InfoFormatter.format_error(f"Unknown setup type: {setup_type}"))
             print("💡 Try: stratequeue setup")
             return 1
 
+    def _report_setup_result(self, configured_name: str | None) -> int:
+        """
+        Report the outcome of an interactive setup flow
+
+        Args:
+            configured_name: Name of the broker/provider that was saved, or None if cancelled
+
+        Returns:
+            Exit code (0 on success, 130 if cancelled)
+        """
+        if configured_name:
+            print(f"✅ {configured_name.capitalize()} credentials saved.")
+            print("💡 Test your setup with: stratequeue status")
+            return 0
+
+        print("⚠️  Setup cancelled.")
+        return 130
+
     def _interactive_broker_setup(self) -> str | None:
         """
         Interactive broker setup flow with questionary
@@ -166,12 +213,11 @@ class SetupCommand(BaseCommand):
             canonical_brokers = set()
             for broker in brokers:
                 # Normalize to canonical name
-                if broker.lower() in ['ibkr', 'interactive-brokers', 'interactive_brokers', 'ib_gateway']:
+                lowered = broker.lower()
+                if lowered in self._IBKR_ALIASES:
                     canonical_brokers.add('ibkr')
-                elif broker.lower() == 'alpaca':
-                    canonical_brokers.add('alpaca')
-                elif broker.lower() == 'ccxt':
-                    canonical_brokers.add('ccxt')
+                elif lowered in ('alpaca', 'ccxt'):
+                    canonical_brokers.add(lowered)
                 elif broker.startswith('ccxt.'):
                     # Skip exchange-specific aliases - they're handled by the main ccxt broker
                     continue
@@ -179,23 +225,11 @@ class SetupCommand(BaseCommand):
                     canonical_brokers.add(broker)
             
             for broker in sorted(canonical_brokers):
-                if broker == "alpaca":
-                    display_name = "Alpaca (US stocks, ETFs, crypto)"
-                    broker_choices.append(display_name)
-                    broker_map[display_name] = broker
-                elif broker == "ibkr":
-                    display_name = "Interactive Brokers (stocks, options, futures, forex)"
-                    broker_choices.append(display_name)
-                    broker_map[display_name] = broker
-                elif broker == "ccxt":
-                    display_name = "CCXT (250+ cryptocurrency exchanges)"
-                    broker_choices.append(display_name)
-                    broker_map[display_name] = broker
-                else:
-                    # Future brokers
-                    display_name = f"{broker.title()} (Coming soon)"
-                    broker_choices.append(display_name)
-                    broker_map[display_name] = broker
+                entry = self._BROKER_SETUPS.get(broker)
+                # Future brokers have no setup flow yet
+                display_name = entry[0] if entry else f"{broker.title()} (Coming soon)"
+                broker_choices.append(display_name)
+                broker_map[display_name] = broker
 
             print("\n🔧 StrateQueue Broker Setup")
             print("=" * 50)
@@ -208,15 +242,11 @@ class SetupCommand(BaseCommand):
 
             broker = broker_map[broker_choice]
 
-            if broker == "alpaca":
-                return self._setup_alpaca()
-            elif broker == "ibkr":
-                return self._setup_ibkr()
-            elif broker == "ccxt":
-                return self._setup_ccxt()
-            else:
+            entry = self._BROKER_SETUPS.get(broker)
+            if entry is None:
                 print(f"❌ {broker.title()} setup not yet implemented.")
                 return None
+            return getattr(self, entry[1])()
 
         except KeyboardInterrupt:
             return None
@@ -703,24 +733,10 @@ class SetupCommand(BaseCommand):
                 return 130
 
             if "Broker" in setup_choice:
-                broker_name = self._interactive_broker_setup()
-                if broker_name:
-                    print(f"✅ {broker_name.capitalize()} credentials saved.")
-                    print("💡 Test your setup with: stratequeue status")
-                    return 0
-                else:
-                    print("⚠️  Setup cancelled.")
-                    return 130
+                return self._report_setup_result(self._interactive_broker_setup())
 
             elif "Data Provider" in setup_choice:
-                provider_name = self._interactive_data_provider_setup()
-                if provider_name:
-                    print(f"✅ {provider_name.capitalize()} credentials saved.")
-                    print("💡 Test your setup with: stratequeue status")
-                    return 0
-                else:
-                    print("⚠️  Setup cancelled.")
-                    return 130
+                return self._report_setup_result(self._interactive_data_provider_setup())
 
         except KeyboardInterrupt:
             return 130
@@ -749,22 +765,11 @@ class SetupCommand(BaseCommand):
             provider_choices = []
             provider_map = {}
             for provider in providers:
-                if provider == "polygon":
-                    display_name = "Polygon (stocks, crypto, forex - premium)"
-                    provider_choices.append(display_name)
-                    provider_map[display_name] = provider
-                elif provider == "coinmarketcap":
-                    display_name = "CoinMarketCap (cryptocurrency data)"
-                    provider_choices.append(display_name)
-                    provider_map[display_name] = provider
-                elif provider == "ccxt":
-                    display_name = "CCXT (250+ cryptocurrency exchanges)"
-                    provider_choices.append(display_name)
-                    provider_map[display_name] = provider
-                elif provider.startswith("ccxt."):
-                    # Skip exchange-specific aliases - they're handled by the main ccxt provider
-                    continue
-                # Skip demo provider in setup - it doesn't need credentials
+                # Exchange-specific ccxt.* aliases and demo have no setup of their own
+                entry = self._PROVIDER_SETUPS.get(provider)
+                if entry:
+                    provider_choices.append(entry[0])
+                    provider_map[entry[0]] = provider
 
             if not provider_choices:
                 print("❌ No data providers requiring setup found.")
@@ -784,15 +789,11 @@ class SetupCommand(BaseCommand):
 
             provider = provider_map[provider_choice]
 
-            if provider == "polygon":
-                return self._setup_polygon()
-            elif provider == "coinmarketcap":
-                return self._setup_coinmarketcap()
-            elif provider == "ccxt":
-                return self._setup_ccxt_data_provider()
-            else:
+            entry = self._PROVIDER_SETUPS.get(provider)
+            if entry is None:
                 print(f"❌ {provider.title()} setup not yet implemented.")
                 return None
+            return getattr(self, entry[1])()
 
         except KeyboardInterrupt:
             return None
@@ -17,6 +17,14 @@ class StatusCommand(BaseCommand):
     Checks system and broker environment status, including credential validation.
     """
 
+    # status_type → InfoFormatter methods rendered in order. "system" is the
+    # holistic view; future health checks (daemon, database, ...) slot in here
+    _SECTIONS = {
+        "broker": ("format_broker_status",),
+        "provider": ("format_provider_status",),
+        "system": ("format_broker_status", "format_provider_status"),
+    }
+
     @property
     def name(self) -> str:
         return "status"
@@ -36,7 +44,7 @@ class StatusCommand(BaseCommand):
             "status_type",
             nargs="?",
             default="system",
-            choices=["broker", "provider", "system"],
+            choices=list(self._SECTIONS),
             help="Type of status to check (default: system = brokers + providers)",
         )
 
@@ -54,25 +62,13 @@ class StatusCommand(BaseCommand):
     def execute(self, args: argparse.Namespace) -> int:
         """Execute status command"""
 
-        if args.status_type == "broker":
-            print(InfoFormatter.format_broker_status())
-            return 0
-
-        elif args.status_type == "provider":
-            print(InfoFormatter.format_provider_status())
-            return 0
-
-        elif args.status_type == "system":
-            # Show both broker and provider status for a holistic view
-            print(InfoFormatter.format_broker_status())
-            print(InfoFormatter.format_provider_status())
-
-            # Placeholder for future system health checks (daemon, database, etc.)
-            return 0
-
-        else:
+        sections = self._SECTIONS.get(args.status_type)
+        if sections is None:
             # This shouldn't happen due to choices constraint, but handle gracefully
             print(InfoFormatter.format_error(f"Unknown status type: {args.status_type}"))
-            print("💡 Available options: broker, provider, system")
+            print(f"💡 Available options: {', '.join(self._SECTIONS)}")
             print("💡 Try: stratequeue status broker")
             return 1
+
+        self._emit(getattr(InfoFormatter, method_name)() for method_name in sections)
+        return 0
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import logging
 import os
 import subprocess
@@ -13,6 +14,12 @@ from .base_command import BaseCommand
 logger = logging.getLogger(__name__)
 
 
+@functools.cache
+def _health_session() -> requests.Session:
+    """Shared session for daemon /health probes (keeps the connection alive while polling)."""
+    return requests.Session()
+
+
 class WebUICommand(BaseCommand):
     """Launch the StrateQueue Web UI (dashboard) in development mode."""
 
@@ -97,10 +104,19 @@ class WebUICommand(BaseCommand):
         process = subprocess.run(["npm", "run", "dev", "--", "--port", str(args.port)], cwd=webui_dir, env=env)
         return process.returncode
 
+    @staticmethod
+    def _reap_daemon(process: subprocess.Popen, timeout: float = 5.0) -> int:
+        """Wait for a signalled daemon to exit, killing it if it lingers."""
+        try:
+            return process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            return process.wait()
+
     def _check_daemon_running(self, port: int = 8400) -> bool:
         """Check if daemon is already running on the specified port."""
         try:
-            response = requests.get(f"http://localhost:{port}/health", timeout=2)
+            response = _health_session().get(f"http://localhost:{port}/health", timeout=2)
             return response.status_code == 200
         except (requests.exceptions.RequestException, requests.exceptions.ConnectionError):
             return False
@@ -117,19 +133,31 @@ class WebUICommand(BaseCommand):
                 start_new_session=True  # Detach from parent process
             )
             
-            # Wait a moment for daemon to start
+            # Wait for the daemon to answer /health. Waiting on the child (rather
+            # than sleeping) returns as soon as it dies, e.g. when the port is taken;
+            # the backoff starts short since the daemon usually binds in well under 1s.
             max_wait = 10  # seconds
-            waited = 0
-            while waited < max_wait:
+            deadline = time.monotonic() + max_wait
+            delay = 0.1
+            while True:
                 if self._check_daemon_running(port):
                     print(f"✅ Daemon started successfully on port {port}")
                     return daemon_process
-                time.sleep(1)
-                waited += 1
+                try:
+                    exit_code = daemon_process.wait(timeout=delay)
+                except subprocess.TimeoutExpired:
+                    pass
+                else:
+                    print(f"❌ Daemon exited with code {exit_code} before it was ready")
+                    return None
+                if time.monotonic() >= deadline:
+                    break
+                delay = min(delay * 2, 1.0)
 
             # If we get here the daemon never came up
             print(f"❌ Failed to start daemon on port {port} after {max_wait}s")
             daemon_process.terminate()
+            self._reap_daemon(daemon_process)
             return None
                 
         except Exception as e:
@@ -11,6 +11,22 @@ from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Status → icon lookup shared by every formatter call
+_STATUS_ICONS = {
+    "active": "🟢",
+    "running": "🟢",
+    "paused": "⏸️",
+    "stopped": "⏹️",
+    "error": "🔴",
+    "failed": "🔴",
+    "warning": "🟡",
+    "pending": "🟡",
+    "unknown": "⚪",
+    "success": "✅",
+    "info": "ℹ️",
+}
+_UNKNOWN_STATUS_ICON = "⚪"
+
 
 class BaseFormatter:
     """
@@ -113,21 +129,7 @@ class BaseFormatter:
         Returns:
             Appropriate emoji icon
         """
-        status_icons = {
-            "active": "🟢",
-            "running": "🟢",
-            "paused": "⏸️",
-            "stopped": "⏹️",
-            "error": "🔴",
-            "failed": "🔴",
-            "warning": "🟡",
-            "pending": "🟡",
-            "unknown": "⚪",
-            "success": "✅",
-            "info": "ℹ️",
-        }
-
-        return status_icons.get(status.lower(), "⚪")
+        return _STATUS_ICONS.get(status.lower(), _UNKNOWN_STATUS_ICON)
 
     @staticmethod
     def format_key_value_list(items: dict[str, Any], indent: str = "  ") -> str:
@@ -7,6 +7,23 @@ granularities, and other informational content.
 
 from .base_formatter import BaseFormatter
 
+# Static text for the bare `list` command; built once at import
+_COMMAND_HELP = "\n".join((
+    "📋 StrateQueue Available Commands",
+    "=" * 50,
+    "Available list commands:",
+    "  brokers         List supported brokers and their features",
+    "  providers       List supported data providers",
+    "",
+    "Usage:",
+    "  stratequeue list brokers         # Show all supported brokers",
+    "  stratequeue list providers       # Show available data providers",
+    "",
+    "Examples:",
+    "  stratequeue list brokers",
+    "  stratequeue list providers",
+))
+
 
 class InfoFormatter(BaseFormatter):
     """
@@ -472,19 +489,4 @@ class InfoFormatter(BaseFormatter):
         Returns:
             Formatted command help
         """
-        output = []
-        output.append("📋 StrateQueue Available Commands")
-        output.append("=" * 50)
-        output.append("Available list commands:")
-        output.append("  brokers         List supported brokers and their features")
-        output.append("  providers       List supported data providers")
-        output.append("")
-        output.append("Usage:")
-        output.append("  stratequeue list brokers         # Show all supported brokers")
-        output.append("  stratequeue list providers       # Show available data providers")
-        output.append("")
-        output.append("Examples:")
-        output.append("  stratequeue list brokers")
-        output.append("  stratequeue list providers")
-
-        return "\n".join(output)
+        return _COMMAND_HELP
@@ -3,7 +3,9 @@
 Utility functions for processing and validating deploy command arguments.
 """
 
+import functools
 import logging
+import math
 import os
 from argparse import Namespace
 from pathlib import Path
@@ -12,6 +14,12 @@ import StrateQueue
 logger = logging.getLogger(__name__)
 
 
+@functools.cache
+def _package_root() -> Path:
+    """Directory holding the installed package (<site-packages>), resolved once"""
+    return Path(StrateQueue.__file__).resolve().parent.parent
+
+
 def parse_comma_separated(value: str) -> list[str]:
     """
     Parse comma-separated string into list of strings
@@ -24,7 +32,7 @@ def parse_comma_separated(value: str) -> list[str]:
     """
     if not value:
         return []
-    return [s.strip() for s in value.split(",") if s.strip()]
+    return [s for s in map(str.strip, value.split(",")) if s]
 
 
 def apply_smart_defaults(values: list[str], target_count: int, arg_name: str) -> list[str]:
@@ -68,7 +76,7 @@ def parse_symbols(symbols_str: str) -> list[str]:
     Returns:
         List of symbol strings
     """
-    return [s.strip().upper() for s in symbols_str.split(",") if s.strip()]
+    return [s.upper() for s in map(str.strip, symbols_str.split(",")) if s]
 
 
 # Re-export the canonical setup_logging function
@@ -87,8 +95,8 @@ def create_inline_strategy_config(args: Namespace) -> str | None:
     if not hasattr(args, "_strategies") or len(args._strategies) <= 1:
         return None
 
-    # Parse symbols for potential 1:1 mapping
-    symbols = parse_symbols(args.symbol)
+    # Parse symbols for potential 1:1 mapping (reuse the validator's result when present)
+    symbols = args._symbols if hasattr(args, "_symbols") else parse_symbols(args.symbol)
 
     # Check if we have 1:1 strategy-to-symbol mapping
     if len(args._strategies) == len(symbols):
@@ -239,10 +247,8 @@ def validate_files_exist(file_paths: list[str]) -> list[str]:
     errors = []
     
     # Helper to resolve bundled demo paths
-    pkg_root = Path(StrateQueue.__file__).resolve().parent.parent  # <site-packages>
-    
     def _resolve_demo(rel_path: str) -> str | None:
-        candidate = (pkg_root / rel_path).resolve()
+        candidate = (_package_root() / rel_path).resolve()
         return str(candidate) if candidate.exists() else None
     
     for i, original in enumerate(file_paths):
@@ -256,46 +262,51 @@ def validate_files_exist(file_paths: list[str]) -> list[str]:
     return errors
 
 
-def validate_allocation_values(allocations: list[str]) -> list[str]:
+def parse_allocation_values(allocations: list[str]) -> tuple[list[float], list[str]]:
     """
-    Validate allocation values for consistency and correctness
+    Parse and validate allocation values in a single pass
+
+    Each value is converted to float once; type mixing and totals are checked
+    from the same sweep, so callers never need to re-parse the strings.
 
     Args:
         allocations: List of allocation strings
 
     Returns:
-        List of error messages
+        Tuple of (parsed allocation values, error messages)
     """
-    errors = []
+    values: list[float] = []
+    errors: list[str] = []
 
     if not allocations:
-        return errors
+        return values, errors
 
-    total_percentage_allocation = 0.0
-    total_dollar_allocation = 0.0
-    has_percentage = False
+    percentage_allocations: list[float] = []
     has_dollar = False
 
     for i, allocation_str in enumerate(allocations):
         try:
             allocation_value = float(allocation_str)
+        except ValueError:
+            errors.append(f"Invalid allocation value: {allocation_str}. Must be a number.")
+            continue
 
-            if allocation_value <= 0:
-                errors.append(f"Allocation {i+1} must be positive, got {allocation_value}")
-                continue
+        values.append(allocation_value)
 
-            # Determine if this is percentage (0-1) or dollar amount (>1)
-            if allocation_value <= 1:
-                # Percentage allocation
-                has_percentage = True
-                total_percentage_allocation += allocation_value
-            else:
-                # Dollar allocation
-                has_dollar = True
-                total_dollar_allocation += allocation_value
+        if allocation_value <= 0:
+            errors.append(f"Allocation {i+1} must be positive, got {allocation_value}")
+            continue
 
-        except ValueError:
-            errors.append(f"Invalid allocation value: {allocation_str}. Must be a number.")
+        # Determine if this is percentage (0-1) or dollar amount (>1)
+        if allocation_value <= 1:
+            # Percentage allocation
+            percentage_allocations.append(allocation_value)
+        else:
+            # Dollar allocation
+            has_dollar = True
+
+    has_percentage = bool(percentage_allocations)
+    total_percentage_allocation = math.fsum(percentage_allocations)
 
     # Check for mixing allocation types
     if has_percentage and has_dollar:
@@ -313,4 +324,18 @@ def validate_allocation_values(allocations: list[str]) -> list[str]:
             f"Total percentage allocation is {total_percentage_allocation:.1%}, which is too small"
         )
 
+    return values, errors
+
+
+def validate_allocation_values(allocations: list[str]) -> list[str]:
+    """
+    Validate allocation values for consistency and correctness
+
+    Args:
+        allocations: List of allocation strings
+
+    Returns:
+        List of error messages
+    """
+    _, errors = parse_allocation_values(allocations)
     return errors
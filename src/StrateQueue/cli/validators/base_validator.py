@@ -6,10 +6,18 @@ different CLI commands for argument validation.
 """
 
 import logging
-from pathlib import Path
+import math
+import os
+import stat
 
 logger = logging.getLogger(__name__)
 
+# Ordered for error messages; membership is checked against the frozensets
+_VALID_DATA_SOURCES = ["polygon", "coinmarketcap", "demo"]
+_VALID_DATA_SOURCE_SET = frozenset(_VALID_DATA_SOURCES)
+_KNOWN_BROKERS = ["alpaca", "ibkr", "IBKR", "interactive-brokers", "interactive_brokers", "td_ameritrade"]
+_KNOWN_BROKER_SET = frozenset(_KNOWN_BROKERS)
+
 
 class BaseValidator:
     """
@@ -36,11 +44,13 @@ class BaseValidator:
         if not file_path:
             return f"{description} path cannot be empty"
 
-        path = Path(file_path)
-        if not path.exists():
+        # One stat answers both "exists" and "is a regular file"
+        try:
+            mode = os.stat(file_path).st_mode
+        except (OSError, ValueError):
             return f"{description} not found: {file_path}"
 
-        if not path.is_file():
+        if not stat.S_ISREG(mode):
             return f"{description} is not a file: {file_path}"
 
         return None
@@ -60,11 +70,12 @@ class BaseValidator:
         if not dir_path:
             return f"{description} path cannot be empty"
 
-        path = Path(dir_path)
-        if not path.exists():
+        try:
+            mode = os.stat(dir_path).st_mode
+        except (OSError, ValueError):
             return f"{description} not found: {dir_path}"
 
-        if not path.is_dir():
+        if not stat.S_ISDIR(mode):
             return f"{description} is not a directory: {dir_path}"
 
         return None
@@ -116,7 +127,7 @@ class BaseValidator:
             if allocation > 1:
                 return f"Allocation {i+1} cannot exceed 100%: {allocation}"
 
-        total = sum(allocations)
+        total = math.fsum(allocations)
         if abs(total - 1.0) > 0.001:  # Allow small floating point errors
             return f"Total allocation must equal 100%, got {total:.1%}"
 
@@ -133,10 +144,8 @@ class BaseValidator:
         Returns:
             Error message if invalid, None if valid
         """
-        valid_sources = ["polygon", "coinmarketcap", "demo"]
-
-        if data_source not in valid_sources:
-            return f"Invalid data source: {data_source}. Must be one of: {valid_sources}"
+        if data_source not in _VALID_DATA_SOURCE_SET:
+            return f"Invalid data source: {data_source}. Must be one of: {_VALID_DATA_SOURCES}"
 
         return None
 
@@ -166,9 +175,8 @@ class BaseValidator:
                     return f"Unsupported broker: {broker}. Supported: {list(supported.keys())}"
             except ImportError:
                 # Basic validation if broker module not available
-                known_brokers = ["alpaca", "ibkr", "IBKR", "interactive-brokers", "interactive_brokers", "td_ameritrade"]
-                if broker not in known_brokers:
-                    return f"Unknown broker: {broker}. Known brokers: {known_brokers}"
+                if broker not in _KNOWN_BROKER_SET:
+                    return f"Unknown broker: {broker}. Known brokers: {_KNOWN_BROKERS}"
 
         return None
 
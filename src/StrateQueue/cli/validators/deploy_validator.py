@@ -5,19 +5,34 @@ multi-strategy validation, broker validation, and trading mode validation.
 """
 
 import os
+import sys
 from argparse import Namespace
 
 from ...core.granularity import validate_granularity
+from ...utils.console import write_lines
 from ..utils.deploy_utils import (
     apply_smart_defaults,
     generate_strategy_ids,
+    parse_allocation_values,
     parse_comma_separated,
     parse_symbols,
-    validate_allocation_values,
     validate_files_exist,
 )
 from .base_validator import BaseValidator
 
+# Broker names that map to the IBKR data source
+_IBKR_BROKER_ALIASES = frozenset({
+    'ibkr', 'IBKR', 'interactive-brokers', 'interactive_brokers',
+    'ib_gateway', 'ibkr_gateway', 'ib-gateway', 'gateway',
+})
+
+# Banner shown before a --live deploy
+_LIVE_TRADING_WARNING = (
+    "🚨 LIVE TRADING MODE ENABLED",
+    "⚠️  You are about to trade with real money!",
+    "💰 Please ensure you have tested your strategy thoroughly in paper trading first.",
+)
+
 
 class DeployValidator(BaseValidator):
     """Validator for deploy command arguments"""
@@ -114,7 +129,6 @@ class DeployValidator(BaseValidator):
 
         # Auto-detect data source based on broker if using default 'demo' (not explicitly specified)
         # Check if --data-source was explicitly provided by the user
-        import sys
         data_source_explicitly_set = '--data-source' in sys.argv
         if data_sources == ['demo'] and not data_source_explicitly_set:
             # Check if brokers are specified
@@ -126,7 +140,7 @@ class DeployValidator(BaseValidator):
                         # Handle specific broker mappings first
                         if broker == 'alpaca':
                             mapped_data_sources.append('alpaca')
-                        elif broker in ['ibkr', 'IBKR', 'interactive-brokers', 'interactive_brokers', 'ib_gateway', 'ibkr_gateway', 'ib-gateway', 'gateway']:
+                        elif broker in _IBKR_BROKER_ALIASES:
                             mapped_data_sources.append('ibkr')
                         else:
                             # General case: default data source to same as broker
@@ -136,16 +150,7 @@ class DeployValidator(BaseValidator):
                 
                 if mapped_data_sources:
                     data_sources = mapped_data_sources
-                    if len(set(mapped_data_sources)) == 1:
-                        # All brokers map to the same data source
-                        print(f"🔗 Auto-detected {brokers[0]} broker(s) - using {mapped_data_sources[0]} data source")
-                    else:
-                        # Multiple different data sources
-                        print(f"🔗 Auto-detected brokers - mapping to corresponding data sources")
-                        for i, (broker, ds) in enumerate(zip(brokers, mapped_data_sources)):
-                            if broker:
-                                print(f"   Strategy {i+1}: {broker} → {ds}")
-                    print("💡 Override with --data-source if you prefer a different source")
+                    write_lines(self._format_data_source_mapping(brokers, mapped_data_sources))
             else:
                 # Try to auto-detect broker from environment
                 try:
@@ -155,17 +160,18 @@ class DeployValidator(BaseValidator):
                         # Handle specific broker mappings first
                         if detected_broker == 'alpaca':
                             data_sources = ['alpaca']
-                            print("🔗 Auto-detected Alpaca broker - using Alpaca data source")
-                            print("💡 Override with --data-source if you prefer a different source")
-                        elif detected_broker in ['ibkr', 'IBKR', 'interactive-brokers', 'interactive_brokers', 'ib_gateway', 'ibkr_gateway', 'ib-gateway', 'gateway']:
+                            label = "Alpaca"
+                        elif detected_broker in _IBKR_BROKER_ALIASES:
                             data_sources = ['ibkr']
-                            print("🔗 Auto-detected IBKR broker - using IBKR data source")
-                            print("💡 Override with --data-source if you prefer a different source")
+                            label = "IBKR"
                         else:
                             # General case: default data source to same as broker
                             data_sources = [detected_broker]
-                            print(f"🔗 Auto-detected {detected_broker} broker - using {detected_broker} data source")
-                            print("💡 Override with --data-source if you prefer a different source")
+                            label = detected_broker
+                        write_lines((
+                            f"🔗 Auto-detected {label} broker - using {label} data source",
+                            "💡 Override with --data-source if you prefer a different source",
+                        ))
                 except ImportError:
                     pass
 
@@ -196,10 +202,9 @@ class DeployValidator(BaseValidator):
         except ValueError as e:
             errors.append(str(e))
 
-        # Validate allocation values if we have them
-        if allocations:
-            allocation_errors = validate_allocation_values(allocations)
-            errors.extend(allocation_errors)
+        # Parse and validate allocation values in one pass
+        allocation_values, allocation_errors = parse_allocation_values(allocations)
+        errors.extend(allocation_errors)
 
         # Generate strategy IDs if not provided
         if not strategy_ids:
@@ -207,8 +212,10 @@ class DeployValidator(BaseValidator):
 
         # Store parsed values back to args for later use
         args._strategies = strategies
+        args._strategy_basename = os.path.basename(strategies[0])
         args._strategy_ids = strategy_ids
         args._allocations = allocations
+        args._allocation_values = allocation_values
         args._data_sources = data_sources
         args._granularities = granularities
         args._brokers = brokers
@@ -226,6 +233,8 @@ class DeployValidator(BaseValidator):
             symbols = parse_symbols(args.symbol)
             if not symbols or any(not s for s in symbols):
                 errors.append("Invalid symbols format. Use comma-separated list like 'AAPL,MSFT'")
+            # Store parsed symbols so the deploy path doesn't re-tokenize
+            args._symbols = symbols
         except Exception:
             errors.append("Error parsing symbols")
 
@@ -267,8 +276,9 @@ class DeployValidator(BaseValidator):
             try:
                 from ...brokers import get_supported_brokers
                 supported = get_supported_brokers()
+                supported_set = frozenset(supported)
                 for broker in args._brokers:
-                    if broker and broker not in supported:
+                    if broker and broker not in supported_set:
                         errors.append(f"Unsupported broker '{broker}'. Supported: {', '.join(supported)}")
             except ImportError:
                 errors.append("Broker functionality not available (missing dependencies)")
@@ -300,9 +310,7 @@ class DeployValidator(BaseValidator):
 
             # Special validation for live trading
             if args.live:
-                print("🚨 LIVE TRADING MODE ENABLED")
-                print("⚠️  You are about to trade with real money!")
-                print("💰 Please ensure you have tested your strategy thoroughly in paper trading first.")
+                write_lines(_LIVE_TRADING_WARNING)
 
         except ImportError:
             errors.append("Trading functionality not available (missing dependencies). Please reinstall the package: pip install stratequeue")
@@ -315,10 +323,33 @@ class DeployValidator(BaseValidator):
             try:
                 symbols = parse_symbols(symbols_str)
                 if len(strategies) == len(symbols):
-                    print("📌 1:1 Strategy-Symbol mapping detected:")
-                    for _i, (strategy, symbol) in enumerate(zip(strategies, symbols, strict=False)):
-                        strategy_name = os.path.basename(strategy).replace('.py', '')
-                        print(f"   {strategy_name} → {symbol}")
-                    print()
+                    write_lines(self._format_strategy_symbol_mapping(strategies, symbols))
             except:
                 pass  # symbols might not be parsed yet, ignore validation here
+
+    @staticmethod
+    def _format_data_source_mapping(brokers: list[str], data_sources: list[str]) -> list[str]:
+        """Return the lines announcing broker-derived data sources"""
+        if len(set(data_sources)) == 1:
+            # All brokers map to the same data source
+            lines = [f"🔗 Auto-detected {brokers[0]} broker(s) - using {data_sources[0]} data source"]
+        else:
+            # Multiple different data sources
+            lines = ["🔗 Auto-detected brokers - mapping to corresponding data sources"]
+            lines.extend(
+                f"   Strategy {i+1}: {broker} → {ds}"
+                for i, (broker, ds) in enumerate(zip(brokers, data_sources))
+                if broker
+            )
+        lines.append("💡 Override with --data-source if you prefer a different source")
+        return lines
+
+    @staticmethod
+    def _format_strategy_symbol_mapping(strategies: list[str], symbols: list[str]) -> list[str]:
+        """Return the lines of the 1:1 strategy-symbol mapping"""
+        lines = ["📌 1:1 Strategy-Symbol mapping detected:"]
+        for strategy, symbol in zip(strategies, symbols, strict=False):
+            strategy_name = os.path.basename(strategy).replace('.py', '')
+            lines.append(f"   {strategy_name} → {symbol}")
+        lines.append("")
+        return lines
@@ -17,6 +17,15 @@ class TimeUnit(Enum):
     DAY = "d"
 
 
+# Seconds per unit, shared by every Granularity.to_seconds() call
+_UNIT_SECONDS = {
+    TimeUnit.SECOND: 1,
+    TimeUnit.MINUTE: 60,
+    TimeUnit.HOUR: 3600,
+    TimeUnit.DAY: 86400,
+}
+
+
 @dataclass
 class Granularity:
     """Represents a data granularity specification"""
@@ -41,16 +50,10 @@ class Granularity:
 
     def to_seconds(self) -> int:
         """Convert granularity to total seconds"""
-        if self.unit == TimeUnit.SECOND:
-            return self.multiplier
-        elif self.unit == TimeUnit.MINUTE:
-            return self.multiplier * 60
-        elif self.unit == TimeUnit.HOUR:
-            return self.multiplier * 3600
-        elif self.unit == TimeUnit.DAY:
-            return self.multiplier * 86400
-        else:
+        unit_seconds = _UNIT_SECONDS.get(self.unit)
+        if unit_seconds is None:
             raise ValueError(f"Unsupported time unit: {self.unit}")
+        return self.multiplier * unit_seconds
 
 
 class GranularityParser:
@@ -86,16 +89,8 @@ class GranularityParser:
         if multiplier <= 0:
             raise ValueError(f"Multiplier must be positive, got: {multiplier}")
 
-        # Map unit string to TimeUnit enum
-        unit_map = {
-            's': TimeUnit.SECOND,
-            'm': TimeUnit.MINUTE,
-            'h': TimeUnit.HOUR,
-            'd': TimeUnit.DAY
-        }
-
-        unit = unit_map[unit_str]
-        return Granularity(multiplier, unit)
+        # Unit letters are the TimeUnit values; PATTERN only admits valid ones
+        return Granularity(multiplier, TimeUnit(unit_str))
 
     @classmethod
     def validate_for_data_source(cls, granularity: Granularity, data_source: str) -> bool:
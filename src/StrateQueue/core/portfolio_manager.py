@@ -10,10 +10,14 @@ This module handles:
 """
 
 import logging
+import math
 from dataclasses import dataclass, field
 
 logger = logging.getLogger(__name__)
 
+# Slack for float noise when checking that rebalanced allocations fit in 100%
+_ALLOCATION_EPSILON = 1e-9
+
 
 @dataclass
 class StrategyPosition:
@@ -123,7 +127,7 @@ class SimplePortfolioManager:
                 return False
 
             # Check if new allocation would exceed 100%
-            current_total = sum(
+            current_total = math.fsum(
                 alloc.allocation_percentage for alloc in self.strategy_allocations.values()
             )
             if current_total + allocation_percentage > 1.01:  # Allow small rounding error
@@ -157,12 +161,13 @@ class SimplePortfolioManager:
             True if strategy was removed successfully
         """
         try:
-            if strategy_id not in self.strategy_allocations:
+            allocation = self.strategy_allocations.get(strategy_id)
+            if allocation is None:
                 logger.warning(f"Strategy {strategy_id} not found in portfolio, cannot remove")
                 return False
 
             # Log positions that will be affected
-            positions = self.strategy_allocations[strategy_id].positions
+            positions = allocation.positions
             if positions and liquidate_positions:
                 logger.warning(
                     f"Strategy {strategy_id} has {len(positions)} positions that will be orphaned"
@@ -174,7 +179,7 @@ class SimplePortfolioManager:
                         )
 
             # Remove from portfolio
-            removed_allocation = self.strategy_allocations[strategy_id].allocation_percentage
+            removed_allocation = allocation.allocation_percentage
             del self.strategy_allocations[strategy_id]
 
             logger.info(
@@ -197,10 +202,11 @@ class SimplePortfolioManager:
         Returns:
             True if rebalancing was successful
         """
+        old_allocations = {}
         try:
             # Validate new allocations (allow ≤ 100% for cash reserves)
-            total_allocation = sum(new_allocations.values())
-            if total_allocation > 1.0:
+            total_allocation = math.fsum(new_allocations.values())
+            if total_allocation > 1.0 + _ALLOCATION_EPSILON:
                 logger.error(f"New allocations sum to {total_allocation:.1%}, which exceeds 100%")
                 return False
             elif total_allocation <= 0.0:
@@ -215,25 +221,25 @@ class SimplePortfolioManager:
                     f"Keeping {cash_reserve:.1%} in cash reserves."
                 )
 
-            # Check if all strategies exist
-            for strategy_id in new_allocations:
-                if strategy_id not in self.strategy_allocations:
+            # Check all strategies exist, resolving each allocation once for the apply pass
+            targets = []
+            for strategy_id, new_percentage in new_allocations.items():
+                allocation = self.strategy_allocations.get(strategy_id)
+                if allocation is None:
                     logger.error(f"Strategy {strategy_id} not found in portfolio")
                     return False
+                targets.append((strategy_id, allocation, new_percentage))
 
             # Apply new allocations
-            old_allocations = {}
-            for strategy_id, new_percentage in new_allocations.items():
-                old_percentage = self.strategy_allocations[strategy_id].allocation_percentage
+            for strategy_id, allocation, new_percentage in targets:
+                old_percentage = allocation.allocation_percentage
                 old_allocations[strategy_id] = old_percentage
 
-                self.strategy_allocations[strategy_id].allocation_percentage = new_percentage
+                allocation.allocation_percentage = new_percentage
 
                 # Update allocated amounts if account value is set
                 if self.total_account_value > 0:
-                    self.strategy_allocations[strategy_id].total_allocated = (
-                        self.total_account_value * new_percentage
-                    )
+                    allocation.total_allocated = self.total_account_value * new_percentage
 
                 logger.info(f"Strategy {strategy_id}: {old_percentage:.1%} → {new_percentage:.1%}")
 
@@ -282,13 +288,13 @@ class SimplePortfolioManager:
             Tuple of (can_buy: bool, reason: str)
         """
         # Check if strategy exists
-        if strategy_id not in self.strategy_allocations:
+        strategy_alloc = self.strategy_allocations.get(strategy_id)
+        if strategy_alloc is None:
             return False, f"Unknown strategy: {strategy_id}"
 
         # Multiple strategies can now buy the same symbol - no ownership conflict checking
 
         # Check capital availability
-        strategy_alloc = self.strategy_allocations[strategy_id]
         if amount > strategy_alloc.available_capital:
             return False, (
                 f"Insufficient capital for {strategy_id}: "
@@ -312,11 +318,11 @@ class SimplePortfolioManager:
             Tuple of (can_sell: bool, reason: str)
         """
         # Check if strategy exists
-        if strategy_id not in self.strategy_allocations:
+        strategy_alloc = self.strategy_allocations.get(strategy_id)
+        if strategy_alloc is None:
             return False, f"Unknown strategy: {strategy_id}"
 
         # Check if strategy has position in this symbol
-        strategy_alloc = self.strategy_allocations[strategy_id]
         if not strategy_alloc.has_position(symbol):
             return False, f"Strategy {strategy_id} has no position in {symbol}"
 
@@ -343,12 +349,11 @@ class SimplePortfolioManager:
             amount: Dollar amount spent
             quantity: Optional quantity bought (if known)
         """
-        if strategy_id not in self.strategy_allocations:
+        strategy_alloc = self.strategy_allocations.get(strategy_id)
+        if strategy_alloc is None:
             logger.error(f"Cannot record buy for unknown strategy: {strategy_id}")
             return
 
-        strategy_alloc = self.strategy_allocations[strategy_id]
-
         # Update capital tracking
         strategy_alloc.total_spent += amount
 
@@ -384,12 +389,11 @@ class SimplePortfolioManager:
             amount: Dollar amount received
             quantity: Optional quantity sold (if known)
         """
-        if strategy_id not in self.strategy_allocations:
+        strategy_alloc = self.strategy_allocations.get(strategy_id)
+        if strategy_alloc is None:
             logger.error(f"Cannot record sell for unknown strategy: {strategy_id}")
             return
 
-        strategy_alloc = self.strategy_allocations[strategy_id]
-
         # Update capital tracking (add back proceeds)
         strategy_alloc.total_spent -= amount
 
@@ -429,10 +433,11 @@ class SimplePortfolioManager:
         Returns:
             Dictionary mapping symbol to StrategyPosition
         """
-        if strategy_id not in self.strategy_allocations:
+        strategy_alloc = self.strategy_allocations.get(strategy_id)
+        if strategy_alloc is None:
             return {}
 
-        return self.strategy_allocations[strategy_id].positions.copy()
+        return strategy_alloc.positions.copy()
 
     def get_all_symbol_holders(self, symbol: str) -> set[str]:
         """
@@ -460,11 +465,11 @@ class SimplePortfolioManager:
         Returns:
             Dictionary with strategy status information
         """
-        if strategy_id not in self.strategy_allocations:
+        alloc = self.strategy_allocations.get(strategy_id)
+        if alloc is None:
             return {}
 
-        alloc = self.strategy_allocations[strategy_id]
-        position_symbols = list(alloc.positions.keys())
+        position_symbols = list(alloc.positions)
 
         # Calculate total position value
         total_position_value = sum(pos.total_cost for pos in alloc.positions.values())
@@ -5,6 +5,8 @@ from typing import Any
 
 import pandas as pd
 
+from ..utils.price_formatter import PriceFormatter
+
 # Conditional imports for backtesting library
 try:
     from backtesting import Backtest, Strategy
@@ -360,17 +362,22 @@ class LiveSignalExtractor:
             # Get the current signal from the strategy
             current_signal = strategy_instance.get_current_signal()
             
-            # Debug: Log indicator values and raw signal to understand what's happening
-            if hasattr(current_signal, 'indicators') and current_signal.indicators:
-                logger.debug(f"Indicators: {current_signal.indicators}")
-            logger.debug(f"Raw strategy signal: {current_signal.signal.value}")
+            # Debug: Log indicator values and raw signal to understand what's happening.
+            # This runs every bar, so skip building the messages (the indicator
+            # dict repr in particular) unless debug logging is actually on
+            debug = logger.isEnabledFor(logging.DEBUG)
+            if debug:
+                if hasattr(current_signal, 'indicators') and current_signal.indicators:
+                    logger.debug(f"Indicators: {current_signal.indicators}")
+                logger.debug(f"Raw strategy signal: {current_signal.signal.value}")
+                logger.debug(f"Strategy class: {self.strategy_class.__name__}")
+                logger.debug(f"Has n1: {hasattr(self.strategy_class, 'n1')}, Has n2: {hasattr(self.strategy_class, 'n2')}")
             
             # For SMA strategies, use manual crossover detection to fix the sliding window issue
-            logger.debug(f"Strategy class: {self.strategy_class.__name__}")
-            logger.debug(f"Has n1: {hasattr(self.strategy_class, 'n1')}, Has n2: {hasattr(self.strategy_class, 'n2')}")
             if hasattr(self.strategy_class, 'n1') and hasattr(self.strategy_class, 'n2'):
                 manual_signal = self._detect_sma_crossover(historical_data)
-                logger.debug(f"Manual crossover detection result: {manual_signal}")
+                if debug:
+                    logger.debug(f"Manual crossover detection result: {manual_signal}")
                 if manual_signal != 'HOLD':
                     logger.debug(f"Manual crossover detection overriding strategy signal: {manual_signal}")
                     # Create a new signal with the manual detection result
@@ -393,7 +400,6 @@ class LiveSignalExtractor:
 
             self.last_signal = adjusted_signal
 
-            from ..utils.price_formatter import PriceFormatter
             logger.info(
                 f"Extracted signal: {adjusted_signal.signal.value} "
                 f"at price: {PriceFormatter.format_price_for_logging(adjusted_signal.price)} "
@@ -18,7 +18,6 @@ from typing import Any, Dict, List, Optional
 import logging
 
 import pandas as pd
-import empyrical as ep
 import numpy as np
 
 from rich.panel import Panel
@@ -28,9 +27,13 @@ from rich import box
 from rich.text import Text
 
 from .signal_extractor import TradingSignal, SignalType
+from ..utils.price_formatter import PriceFormatter
 
 logger = logging.getLogger(__name__)
 
+# Rich colour per signal type for the session overview panel
+_SIGNAL_COLORS = {"BUY": "green", "SELL": "red", "HOLD": "yellow", "CLOSE": "blue"}
+
 
 @dataclass
 class TradeRecord:
@@ -521,6 +524,8 @@ class StatisticsManager:
             return 0.0
         
         returns = curve.pct_change().dropna()
+        import empyrical as ep  # pulls in scipy; defer until metrics are computed
+
         try:
             return ep.annual_return(returns)
         except Exception:
@@ -530,6 +535,8 @@ class StatisticsManager:
         """Calculate annualized volatility using Empyrical."""
         if rets.empty:
             return 0.0
+        import empyrical as ep
+
         try:
             return ep.annual_volatility(rets)
         except Exception:
@@ -539,6 +546,8 @@ class StatisticsManager:
         """Calculate Sortino ratio using Empyrical."""
         if rets.empty:
             return 0.0
+        import empyrical as ep
+
         try:
             return ep.sortino_ratio(rets, required_return=risk_free_rate)
         except Exception:
@@ -1042,11 +1051,14 @@ class StatisticsManager:
         # Session Overview Panel
         session_panel = self._create_session_panel()
         
+        # Both panels render from one metrics pass (calc_summary_metrics is the expensive part)
+        metrics = self.calc_summary_metrics()
+
         # Basic Info Panel
-        basic_panel = self._create_basic_panel()
+        basic_panel = self._create_basic_panel(metrics)
         
         # Performance Metrics Panel
-        metrics_panel = self._create_metrics_panel()
+        metrics_panel = self._create_metrics_panel(metrics)
         
         # Print all panels
         console.print(session_panel)
@@ -1073,7 +1085,7 @@ class StatisticsManager:
             table.add_row("[bold white]Signal Breakdown:[/bold white]")
             
             for signal_type, count in signal_counts.items():
-                color = {"BUY": "green", "SELL": "red", "HOLD": "yellow", "CLOSE": "blue"}.get(signal_type, "white")
+                color = _SIGNAL_COLORS.get(signal_type, "white")
                 table.add_row(f"  • [{color}]{signal_type}[/{color}]: {count}")
             
             # Latest signals
@@ -1086,20 +1098,20 @@ class StatisticsManager:
                 for symbol, signal_data in latest_items:
                     signal_type = signal_data["signal"]
                     price = signal_data["price"]
-                    color = {"BUY": "green", "SELL": "red", "HOLD": "yellow", "CLOSE": "blue"}.get(signal_type, "white")
-                    from ..utils.price_formatter import PriceFormatter
+                    color = _SIGNAL_COLORS.get(signal_type, "white")
                     table.add_row(f"  • {symbol}: [{color}]{signal_type}[/{color}] @ {PriceFormatter.format_price_for_logging(price)}")
         
         return Panel(table, title="📊 Session Overview", box=box.ROUNDED)
     
-    def _create_basic_panel(self) -> Panel:
+    def _create_basic_panel(self, metrics: Optional[Dict[str, Any]] = None) -> Panel:
         """Create the basic info panel with standardized P&L calculations."""
         table = Table.grid(padding=(0, 2))
         table.add_column(style="bold white", justify="left")
         table.add_column(justify="right")
         
         # Get standardized metrics
-        metrics = self.calc_summary_metrics()
+        if metrics is None:
+            metrics = self.calc_summary_metrics()
         
         # Basic info with standardized calculations
         initial_cash = self._initial_cash
@@ -1124,9 +1136,10 @@ class StatisticsManager:
         
         return Panel(table, title="📈 Basic Info", box=box.ROUNDED)
     
-    def _create_metrics_panel(self) -> Panel:
+    def _create_metrics_panel(self, metrics: Optional[Dict[str, Any]] = None) -> Panel:
         """Create the performance metrics panel with calculated values organized by category."""
-        metrics = self.calc_summary_metrics()
+        if metrics is None:
+            metrics = self.calc_summary_metrics()
         
         table = Table.grid(padding=(0, 2))
         table.add_column(style="bold white", justify="left") 
@@ -5,6 +5,8 @@ Handles all data ingestion, processing, and source management.
 Now includes standardized factory pattern for data providers.
 """
 
+import importlib
+
 # Import factory system - standardized approach
 from .ingestion import IngestionInit, MinimalSignalGenerator, setup_data_ingestion
 from .provider_factory import (
@@ -17,13 +19,14 @@ from .provider_factory import (
     list_provider_features,
     validate_provider_credentials,
 )
-from .sources import (
-    BaseDataIngestion,
-    CoinMarketCapDataIngestion,
-    MarketData,
-    PolygonDataIngestion,
-    TestDataIngestion,
-)
+from .sources import BaseDataIngestion, MarketData
+
+# Concrete providers are resolved on first access, see sources.__getattr__
+_LAZY_PROVIDERS = frozenset({
+    "PolygonDataIngestion",
+    "CoinMarketCapDataIngestion",
+    "TestDataIngestion",
+})
 
 __all__ = [
     # Factory system
@@ -46,3 +49,11 @@ __all__ = [
     "CoinMarketCapDataIngestion",
     "TestDataIngestion",
 ]
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_PROVIDERS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(".sources", __name__), name)
+    globals()[name] = value
+    return value
@@ -7,7 +7,7 @@ High-level utilities for setting up data ingestion with historical data fetching
 import asyncio
 import logging
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 from enum import Enum, auto
 
 # Load environment variables from .env file
@@ -15,7 +15,8 @@ from dotenv import load_dotenv
 
 # Import the factory system
 from .provider_factory import create_data_source
-from .sources import BaseDataIngestion, CoinMarketCapDataIngestion, MarketData, PolygonDataIngestion
+from .sources import BaseDataIngestion, MarketData
+from ..utils.price_formatter import PriceFormatter
 
 load_dotenv()
 
@@ -130,22 +131,31 @@ class MinimalSignalGenerator:
         # Simple moving average parameters
         self.short_window = 10
         self.long_window = 20
-        self.price_history = defaultdict(list)
+        # Bounded windows evict the oldest price on append; the moving-average
+        # sums are kept up to date incrementally instead of re-summed per tick
+        self.price_history = defaultdict(lambda: deque(maxlen=self.long_window))
+        self._short_sum = defaultdict(float)
+        self._long_sum = defaultdict(float)
 
     def on_new_data(self, market_data: MarketData):
         """Process new market data and generate signals"""
         symbol = market_data.symbol
         price = market_data.close
 
-        # Keep price history
-        self.price_history[symbol].append(price)
-        if len(self.price_history[symbol]) > self.long_window:
-            self.price_history[symbol].pop(0)
+        # Keep price history, dropping the prices that leave each window
+        history = self.price_history[symbol]
+        if len(history) >= self.short_window:
+            self._short_sum[symbol] -= history[-self.short_window]
+        if len(history) == self.long_window:
+            self._long_sum[symbol] -= history[0]
+        history.append(price)
+        self._short_sum[symbol] += price
+        self._long_sum[symbol] += price
 
         # Generate simple moving average crossover signal
-        if len(self.price_history[symbol]) >= self.long_window:
-            short_ma = sum(self.price_history[symbol][-self.short_window :]) / self.short_window
-            long_ma = sum(self.price_history[symbol]) / len(self.price_history[symbol])
+        if len(history) >= self.long_window:
+            short_ma = self._short_sum[symbol] / self.short_window
+            long_ma = self._long_sum[symbol] / self.long_window
 
             if short_ma > long_ma:
                 signal = "BUY"
@@ -154,7 +164,6 @@ class MinimalSignalGenerator:
             else:
                 signal = "HOLD"
 
-            from ..utils.price_formatter import PriceFormatter
             logger.info(
                 f"{symbol}: {signal} - Price: {PriceFormatter.format_price_for_logging(price)}, Short MA: {PriceFormatter.format_price_for_logging(short_ma)}, Long MA: {PriceFormatter.format_price_for_logging(long_ma)}"
             )
@@ -241,6 +250,8 @@ if __name__ == "__main__":
     # Parse command line arguments for demo selection
     import sys
 
+    from .sources import CoinMarketCapDataIngestion, PolygonDataIngestion
+
     if len(sys.argv) > 1 and sys.argv[1] == "demo":
         # Run test data demo
         demo_test_data_ingestion()
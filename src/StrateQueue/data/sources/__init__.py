@@ -4,10 +4,17 @@ Data Sources Package
 Contains modular data ingestion classes for different data providers.
 """
 
-from .coinmarketcap import CoinMarketCapDataIngestion
+import importlib
+
 from .data_source_base import BaseDataIngestion, MarketData
-from .demo import TestDataIngestion
-from .polygon import PolygonDataIngestion
+
+# Concrete providers pull in requests/websocket clients; import them on first
+# access (PEP 562) so importing the base types stays cheap
+_LAZY_PROVIDERS = {
+    "PolygonDataIngestion": ".polygon",
+    "CoinMarketCapDataIngestion": ".coinmarketcap",
+    "TestDataIngestion": ".demo",
+}
 
 __all__ = [
     "BaseDataIngestion",
@@ -16,3 +23,12 @@ __all__ = [
     "CoinMarketCapDataIngestion",
     "TestDataIngestion",
 ]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_PROVIDERS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -17,6 +17,13 @@ from ...core.resample import plan_base_granularity, resample_ohlcv
 
 logger = logging.getLogger(__name__)
 
+# Every streamed aggregate goes through a JSON decode; use orjson when it is
+# installed and fall back to the stdlib parser otherwise
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 
 class PolygonDataIngestion(BaseDataIngestion):
     """Polygon.io data ingestion for live trading signals"""
@@ -125,7 +132,7 @@ class PolygonDataIngestion(BaseDataIngestion):
     def _on_ws_message(self, ws, message):
         """Handle incoming WebSocket messages"""
         try:
-            data = json.loads(message)
+            data = _json_loads(message)
 
             # Handle different message types
             for item in data:
@@ -426,7 +426,7 @@ class BtSignalExtractor(BaseSignalExtractor, EngineSignalExtractor):
             if weights is None and result is not None:
                 # Get the first (and usually only) backtest result
                 if isinstance(result, dict) and len(result) > 0:
-                    backtest_result = result[list(result.keys())[0]]
+                    backtest_result = next(iter(result.values()))
                     if hasattr(backtest_result, 'security_weights') and hasattr(backtest_result.security_weights, 'empty'):
                         if not backtest_result.security_weights.empty:
                             weights = backtest_result.security_weights
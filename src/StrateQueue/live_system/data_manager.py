@@ -170,16 +170,14 @@ class DataManager:
                     need_more_bars = len(self.cumulative_data[symbol]) < self.lookback_period
 
                     if time_diff > 0 or need_more_bars:
-                        self.cumulative_data[symbol] = pd.concat(
-                            [self.cumulative_data[symbol], new_bar]
-                        )
-                        # Cap the stored history to the most recent `lookback_period` bars
-                        if len(self.cumulative_data[symbol]) > self.lookback_period:
-                            self.cumulative_data[symbol] = (
-                                self.cumulative_data[symbol]
-                                .tail(self.lookback_period)
-                                .copy()
-                            )
+                        # Cap the stored history to the most recent `lookback_period` bars.
+                        # Trim before concatenating so the capped frame is built in one
+                        # copy rather than concatenated in full and then copied again
+                        history = self.cumulative_data[symbol]
+                        keep = self.lookback_period - 1
+                        if len(history) > keep:
+                            history = history.iloc[len(history) - keep:]
+                        self.cumulative_data[symbol] = pd.concat([history, new_bar])
                         logger.debug(
                             f"📊 Added new bar for {symbol}: ${current_data.close:.8f} "
                             f"(time_diff: {time_diff}s, need_more: {need_more_bars})"
@@ -204,8 +202,8 @@ class DataManager:
 
     def has_sufficient_data(self, symbol: str) -> bool:
         """Check if symbol has sufficient data for strategy"""
-        data = self.get_symbol_data(symbol)
-        return len(data) >= self.lookback_period
+        # Only the row count matters, so skip get_symbol_data's capped copy
+        return len(self.cumulative_data.get(symbol, ())) >= self.lookback_period
 
     def add_symbol_runtime(self, symbol: str) -> bool:
         """
@@ -259,8 +257,7 @@ class DataManager:
 
     def get_data_progress(self, symbol: str) -> tuple[int, int, float]:
         """Get data collection progress for a symbol"""
-        data = self.get_symbol_data(symbol)
-        current_bars = len(data)
         required_bars = self.lookback_period
+        current_bars = min(len(self.cumulative_data.get(symbol, ())), required_bars)
         progress_pct = (current_bars / required_bars * 100) if required_bars > 0 else 100
         return current_bars, required_bars, progress_pct
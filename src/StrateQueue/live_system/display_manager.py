@@ -11,10 +11,13 @@ Handles all display and logging operations for the live trading system:
 import logging
 
 from ..core.signal_extractor import TradingSignal
+from ..utils.console import write_lines
 from ..utils.price_formatter import PriceFormatter
 
 logger = logging.getLogger(__name__)
 
+_SIGNAL_EMOJI = {"BUY": "📈", "SELL": "📉", "CLOSE": "🔄", "HOLD": "⏸️"}
+
 
 class DisplayManager:
     """Manages display output and logging for live trading"""
@@ -120,13 +123,12 @@ class DisplayManager:
     ):
         """Display a trading signal"""
         timestamp_str = signal.timestamp.strftime("%Y-%m-%d %H:%M:%S")
-        signal_emoji = {"BUY": "📈", "SELL": "📉", "CLOSE": "🔄", "HOLD": "⏸️"}
 
         strategy_info = f" [{strategy_id}]" if strategy_id else ""
 
         print(f"\n🎯 SIGNAL #{count} - {timestamp_str}{strategy_info}")
         print(f"Symbol: {symbol}")
-        print(f"Action: {signal_emoji.get(signal.signal.value, '❓')} {signal.signal.value}")
+        print(f"Action: {_SIGNAL_EMOJI.get(signal.signal.value, '❓')} {signal.signal.value}")
         # Print full OHLCV if available in metadata for easier debugging
         ohlcv = signal.metadata.get("bar") if hasattr(signal, "metadata") and signal.metadata else None
         if isinstance(ohlcv, dict) and all(k in ohlcv for k in ("Open","High","Low","Close","Volume")):
@@ -186,11 +188,12 @@ class DisplayManager:
 
     def display_session_summary(self, active_signals: dict, broker_executor=None):
         """Display trading session summary"""
-        print(f"\n{'='*60}")
-        print("📊 SESSION SUMMARY")
-        print(f"{'='*60}")
-
-        print(f"Total Signals Generated: {len(self.trade_log)}")
+        lines = [
+            f"\n{'='*60}",
+            "📊 SESSION SUMMARY",
+            f"{'='*60}",
+            f"Total Signals Generated: {len(self.trade_log)}",
+        ]
 
         if self.trade_log:
             # Signal breakdown
@@ -199,60 +202,65 @@ class DisplayManager:
                 signal_type = trade["signal"]
                 signal_counts[signal_type] = signal_counts.get(signal_type, 0) + 1
 
-            print("\nSignal Breakdown:")
-            for signal_type, count in signal_counts.items():
-                print(f"  • {signal_type}: {count}")
+            lines.append("\nSignal Breakdown:")
+            lines.extend(f"  • {signal_type}: {count}" for signal_type, count in signal_counts.items())
 
             # Latest signals
-            print("\nLatest Signals:")
+            lines.append("\nLatest Signals:")
             if self.is_multi_strategy:
                 for symbol, signal_or_signals in active_signals.items():
                     if isinstance(signal_or_signals, dict):
                         for strategy_id, signal in signal_or_signals.items():
-                            print(
+                            lines.append(
                                 f"  • {symbol} [{strategy_id}]: {signal.signal.value} @ {PriceFormatter.format_price_for_display(signal.price)}"
                             )
                     else:
-                        print(f"  • {symbol}: No signals")
+                        lines.append(f"  • {symbol}: No signals")
             else:
                 for symbol, signal in active_signals.items():
-                    print(f"  • {symbol}: {signal.signal.value} @ {PriceFormatter.format_price_for_display(signal.price)}")
+                    lines.append(f"  • {symbol}: {signal.signal.value} @ {PriceFormatter.format_price_for_display(signal.price)}")
 
         # Show trading summary if enabled
         if broker_executor:
-            self._display_trading_summary(broker_executor)
+            lines.extend(self._trading_summary_lines(broker_executor))
+
+        # One write for the whole block; the statistics display prints on its own
+        write_lines(lines)
 
         # Show statistics summary if available
         if self.statistics_manager:
             print()  # Add some spacing before the enhanced display
             self.statistics_manager.display_enhanced_summary()
 
-        print("\nTrade log saved to stratequeue.log")
-        print(f"{'='*60}")
+        write_lines(("\nTrade log saved to stratequeue.log", f"{'='*60}"))
 
-    def _display_trading_summary(self, broker_executor):
-        """Display trading/portfolio summary"""
+    def _trading_summary_lines(self, broker_executor) -> list[str]:
+        """Build trading/portfolio summary lines"""
         try:
             account_info = broker_executor.get_account_info()
             positions = broker_executor.get_positions()
 
-            print("\n📈 TRADING SUMMARY:")
-            print(f"  Portfolio Value: ${account_info.get('portfolio_value', 0):,.2f}")
-            print(f"  Cash: ${account_info.get('cash', 0):,.2f}")
-            print(f"  Day Trades: {account_info.get('daytrade_count', 0)}")
+            lines = [
+                "\n📈 TRADING SUMMARY:",
+                f"  Portfolio Value: ${account_info.get('portfolio_value', 0):,.2f}",
+                f"  Cash: ${account_info.get('cash', 0):,.2f}",
+                f"  Day Trades: {account_info.get('daytrade_count', 0)}",
+            ]
 
             if positions:
-                print("\n🎯 ACTIVE POSITIONS:")
+                lines.append("\n🎯 ACTIVE POSITIONS:")
                 for symbol, pos in positions.items():
-                    print(
+                    lines.append(
                         f"  • {symbol}: {PriceFormatter.format_quantity(pos['qty'])} shares @ {PriceFormatter.format_price_for_display(pos['avg_entry_price'])} "
                         f"(P&L: {PriceFormatter.format_price_for_display(pos['unrealized_pl'])})"
                     )
             else:
-                print("\n🎯 No active positions")
+                lines.append("\n🎯 No active positions")
+
+            return lines
 
         except Exception as e:
-            print(f"\n❌ Error getting trading summary: {e}")
+            return [f"\n❌ Error getting trading summary: {e}"]
 
     def get_trade_log(self) -> list[dict]:
         """Get the current trade log"""
@@ -14,6 +14,9 @@ import time
 
 logger = logging.getLogger(__name__)
 
+# Shared default for symbols without callbacks/buffer; avoids a fresh [] per tick
+_EMPTY: tuple = ()
+
 
 class IBDataManager:
     """
@@ -88,7 +91,7 @@ class IBDataManager:
                 self._update_buffer(symbol, enhanced_data)
                 
                 # Call strategy callbacks
-                for callback_func in self.subscribers.get(symbol, []):
+                for callback_func in self.subscribers.get(symbol, _EMPTY):
                     try:
                         callback_func(symbol, data_type, enhanced_data)
                     except Exception as e:
@@ -217,14 +220,16 @@ class IBDataManager:
         # Extract prices and timestamps
         prices = []
         timestamps = []
+        # Fallback timestamp for points missing one; taken once, not per point
+        now = datetime.now()
         
         for data_point in buffer:
             if 'last_price' in data_point and data_point['last_price'] is not None:
                 prices.append(data_point['last_price'])
-                timestamps.append(data_point.get('received_at', datetime.now()))
+                timestamps.append(data_point.get('received_at', now))
             elif 'close' in data_point:  # Bar data
                 prices.append(data_point['close'])
-                timestamps.append(data_point.get('datetime', data_point.get('received_at', datetime.now())))
+                timestamps.append(data_point.get('datetime', data_point.get('received_at', now)))
         
         if prices:
             return pd.Series(prices, index=timestamps)
@@ -288,7 +293,7 @@ class IBDataManager:
                     'symbol': symbol,
                     'subscription_type': self.subscription_types.get(symbol, 'unknown'),
                     'callback_count': len(self.subscribers[symbol]),
-                    'buffer_size': len(self.data_buffer.get(symbol, [])),
+                    'buffer_size': len(self.data_buffer.get(symbol, _EMPTY)),
                     'latest_data': self.get_latest_data(symbol)
                 }
             return info
@@ -317,7 +322,8 @@ class IBDataManager:
     
     def _cleanup_old_data(self):
         """Clean up old data from buffers"""
-        cutoff_time = datetime.now() - timedelta(hours=24)  # Keep last 24 hours
+        now = datetime.now()
+        cutoff_time = now - timedelta(hours=24)  # Keep last 24 hours
         
         with self.data_lock:
             for symbol in list(self.data_buffer.keys()):
@@ -325,7 +331,7 @@ class IBDataManager:
                     # Filter out old data
                     self.data_buffer[symbol] = [
                         dp for dp in self.data_buffer[symbol]
-                        if dp.get('received_at', datetime.now()) > cutoff_time
+                        if dp.get('received_at', now) > cutoff_time
                     ]
                     
                     # Remove empty buffers
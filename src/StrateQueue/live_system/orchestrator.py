@@ -412,6 +412,9 @@ class LiveTradingSystem:
 
     async def _execute_signals(self, signals):
         """Execute trading signals via broker"""
+        # Resolve the broker entry point once per batch rather than per signal
+        execute_signal = getattr(self.broker_executor, 'execute_signal', None)
+
         if self.is_multi_strategy:
             # Multi-strategy signals: Dict[symbol, Dict[strategy_id, signal]]
             for symbol, strategy_signals in signals.items():
@@ -419,8 +422,8 @@ class LiveTradingSystem:
                     for strategy_id, signal in strategy_signals.items():
                         if signal.signal != SignalType.HOLD:
                             # Handle both new broker interface and legacy Alpaca executor
-                            if hasattr(self.broker_executor, 'execute_signal'):
-                                result = self.broker_executor.execute_signal(symbol, signal)
+                            if execute_signal is not None:
+                                result = execute_signal(symbol, signal)
                                 if hasattr(result, 'success'):  # New broker interface returns OrderResult
                                     success = result.success
                                 else:  # Legacy interface returns boolean
@@ -437,8 +440,8 @@ class LiveTradingSystem:
             for symbol, signal in signals.items():
                 if signal.signal != SignalType.HOLD:
                     # Handle both new broker interface and legacy Alpaca executor
-                    if hasattr(self.broker_executor, 'execute_signal'):
-                        result = self.broker_executor.execute_signal(symbol, signal)
+                    if execute_signal is not None:
+                        result = execute_signal(symbol, signal)
                         if hasattr(result, 'success'):  # New broker interface returns OrderResult
                             success = result.success
                         else:  # Legacy interface returns boolean
@@ -126,8 +126,10 @@ class TradingProcessor:
         current_prices = {}
         symbol_data = {}
         
-        # Collect data for all symbols
+        # Collect data for all symbols; warm-up progress is gathered and logged
+        # as a single record per cycle rather than one per symbol
         all_symbols_ready = True
+        warming_up = []
         for symbol in self.symbols:
             try:
                 # Update data for this symbol
@@ -156,13 +158,16 @@ class TradingProcessor:
                     all_symbols_ready = False
                     # Show progress towards having enough data
                     current_bars, required_bars, progress_pct = data_manager.get_data_progress(symbol)
-                    logger.info(
-                        f"Building {symbol} data: {current_bars}/{required_bars} bars ({progress_pct:.1f}% complete)"
+                    warming_up.append(
+                        f"{symbol} {current_bars}/{required_bars} bars ({progress_pct:.1f}% complete)"
                     )
                     
             except Exception as e:
                 logger.error(f"Error collecting data for {symbol}: {e}")
                 all_symbols_ready = False
+
+        if warming_up:
+            logger.info(f"Building data: {', '.join(warming_up)}")
         
         # If all symbols have sufficient data, run vectorized extraction
         if all_symbols_ready and symbol_data:
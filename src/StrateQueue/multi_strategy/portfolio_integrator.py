@@ -15,6 +15,16 @@ from ..core.signal_extractor import SignalType, TradingSignal
 
 logger = logging.getLogger(__name__)
 
+_STATUS_RULE = "=" * 60
+
+# One format call per strategy block in the status summary
+_format_strategy_block = (
+    "Strategy: {} ({:.1f}%)\n"
+    "  Allocated: ${:,.2f}\n"
+    "  Available: ${:,.2f}\n"
+    "  Positions: {} ({})\n"
+).format
+
 
 class PortfolioIntegrator:
     """Integrates multi-strategy trading with portfolio management"""
@@ -195,23 +205,27 @@ class PortfolioIntegrator:
 
         status = self.portfolio_manager.get_all_status()
 
-        lines = []
-        lines.append("=" * 60)
-        lines.append("MULTI-STRATEGY PORTFOLIO STATUS")
-        lines.append("=" * 60)
-        lines.append(f"Total Account Value: ${status['total_account_value']:,.2f}")
-        lines.append(f"Active Positions: {status['total_unique_symbols']}")
-        lines.append("")
-
-        for strategy_id, strategy_info in status["strategies"].items():
-            allocation_pct = strategy_info["allocation_percentage"] * 100
-            lines.append(f"Strategy: {strategy_id} ({allocation_pct:.1f}%)")
-            lines.append(f"  Allocated: ${strategy_info['total_allocated']:,.2f}")
-            lines.append(f"  Available: ${strategy_info['available_capital']:,.2f}")
-            lines.append(
-                f"  Positions: {strategy_info['position_count']} ({', '.join(strategy_info['held_symbols'])})"
+        lines = [
+            _STATUS_RULE,
+            "MULTI-STRATEGY PORTFOLIO STATUS",
+            _STATUS_RULE,
+            f"Total Account Value: ${status['total_account_value']:,.2f}",
+            f"Active Positions: {status['total_unique_symbols']}",
+            "",
+        ]
+
+        # Each block ends with a newline, which the join turns into the blank separator line
+        lines.extend(
+            _format_strategy_block(
+                strategy_id,
+                strategy_info["allocation_percentage"] * 100,
+                strategy_info["total_allocated"],
+                strategy_info["available_capital"],
+                strategy_info["position_count"],
+                ", ".join(strategy_info["held_symbols"]),
             )
-            lines.append("")
+            for strategy_id, strategy_info in status["strategies"].items()
+        )
 
         return "\n".join(lines)
 
@@ -305,15 +319,16 @@ class PortfolioIntegrator:
             return False, "Portfolio manager not initialized"
 
         try:
+            # get_all_status() always fills these keys, so index them directly
             status = self.portfolio_manager.get_all_status()
-            total_value = status.get("total_account_value", 0)
+            total_value = status["total_account_value"]
 
             if total_value <= 0:
                 return False, "Account value is zero or negative"
 
             # Check if any strategy has excessive allocation
-            for strategy_id, strategy_info in status.get("strategies", {}).items():
-                allocation = strategy_info.get("allocation_percentage", 0)
+            for strategy_id, strategy_info in status["strategies"].items():
+                allocation = strategy_info["allocation_percentage"]
                 if allocation > 0.5:  # More than 50% to one strategy
                     return (
                         False,
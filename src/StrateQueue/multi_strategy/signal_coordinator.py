@@ -9,10 +9,12 @@ Handles signal generation and validation across multiple strategies:
 - Hot swapping strategies at runtime
 """
 
+import asyncio
 import logging
 
 from ..core.signal_extractor import LiveSignalExtractor, SignalType, TradingSignal
 from ..core.strategy_loader import StrategyLoader
+from ..utils.price_formatter import PriceFormatter
 from .strategy_config import StrategyConfig
 
 logger = logging.getLogger(__name__)
@@ -239,7 +241,6 @@ class SignalCoordinator:
 
                 # Log non-hold signals
                 if signal.signal != SignalType.HOLD:
-                    from ..utils.price_formatter import PriceFormatter
                     logger.info(
                         f"Signal from {strategy_id} for {symbol}: {signal.signal.value} "
                         f"@ {PriceFormatter.format_price_for_logging(signal.price)}"
@@ -256,6 +257,10 @@ class SignalCoordinator:
                     strategy_id=strategy_id,
                 )
 
+            # Signal extraction is CPU-bound; let other tasks (data feeds,
+            # stats server, runtime hot swaps) run between strategies
+            await asyncio.sleep(0)
+
         return signals
 
     def validate_signal(
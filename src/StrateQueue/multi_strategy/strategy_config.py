@@ -8,6 +8,7 @@ Handles loading, parsing, and validation of multi-strategy configurations:
 """
 
 import logging
+import math
 import os
 from dataclasses import dataclass
 
@@ -64,7 +65,6 @@ class ConfigManager:
         with open(self.config_file_path) as f:
             lines = f.readlines()
 
-        total_allocation = 0.0
         for line_num, line in enumerate(lines, 1):
             line = line.strip()
 
@@ -79,7 +79,6 @@ class ConfigManager:
                 raise ValueError(f"Duplicate strategy ID: {config.strategy_id}")
 
             self.strategy_configs[config.strategy_id] = config
-            total_allocation += config.allocation
 
             logger.info(f"Loaded strategy config: {config.strategy_id} "
                        f"({config.file_path}, {config.allocation:.1%})")
@@ -88,6 +87,7 @@ class ConfigManager:
             raise ValueError("No strategies found in configuration file")
 
         # Validate total allocation
+        total_allocation = math.fsum(c.allocation for c in self.strategy_configs.values())
         if abs(total_allocation - 1.0) > 0.01:  # Allow small rounding errors
             logger.warning(f"Total allocation is {total_allocation:.1%}, not 100%")
 
@@ -0,0 +1,19 @@
+"""
+Console output helpers
+
+Shared by the CLI commands and the live trading display so multi-line blocks
+reach stdout in one write instead of one print call per line.
+"""
+
+import sys
+from collections.abc import Iterable
+
+
+def write_lines(lines: Iterable[str]) -> None:
+    """
+    Write a block of lines to stdout in a single call
+
+    Args:
+        lines: Lines to print (without trailing newlines)
+    """
+    sys.stdout.write("".join(f"{line}\n" for line in lines))
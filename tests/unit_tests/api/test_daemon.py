@@ -26,6 +26,9 @@ D. Configuration Management
    D2  POST /config saves valid configuration to credentials file
    D3  POST /config validates and filters empty values
    D4  POST /config handles edge cases (empty payload, no valid config)
+   D5  GET /config reparses credentials only when the file changes
+   D6  POST /config replaces the credentials file atomically
+   D7  POST /config leaves no temp file behind when the write fails
 
 E. File Upload
    E1  POST /upload_strategy saves uploaded files to correct directory
@@ -52,6 +55,7 @@ from __future__ import annotations
 
 import asyncio
 import json
+import os
 import socket
 import subprocess
 import sys
@@ -311,16 +315,10 @@ POLYGON_API_KEY=test_polygon_789
         # Should return empty dict
         assert data == {}
     
-    @patch('StrateQueue.api.daemon.CRED_FILE')
-    def test_post_config_saves_valid_configuration(self, mock_cred_file):
+    def test_post_config_saves_valid_configuration(self, tmp_path):
         """D2: POST /config saves valid configuration to credentials file"""
-        # Mock existing file read
-        mock_cred_file.exists.return_value = True
-        mock_cred_file.read_text.return_value = "EXISTING_KEY=old_value\n"
-        
-        # Mock file write
-        mock_cred_file.parent.mkdir = Mock()
-        mock_cred_file.write_text = Mock()
+        cred_file = tmp_path / "credentials.env"
+        cred_file.write_text("EXISTING_KEY=old_value\n")
         
         client = TestClient(app)
         payload = {
@@ -328,7 +326,8 @@ POLYGON_API_KEY=test_polygon_789
             "ALPACA_SECRET_KEY": "new_secret_456"
         }
         
-        response = client.post("/config", json=payload)
+        with patch('StrateQueue.api.daemon.CRED_FILE', cred_file):
+            response = client.post("/config", json=payload)
         
         assert response.status_code == 200
         data = response.json()
@@ -338,16 +337,13 @@ POLYGON_API_KEY=test_polygon_789
         assert "ALPACA_API_KEY" in data["saved_keys"]
         assert "ALPACA_SECRET_KEY" in data["saved_keys"]
         
-        # Should have called write_text
-        mock_cred_file.write_text.assert_called_once()
-        written_content = mock_cred_file.write_text.call_args[0][0]
-        
         # Check written content includes new and existing keys
+        written_content = cred_file.read_text()
         assert "ALPACA_API_KEY=new_key_123" in written_content
         assert "ALPACA_SECRET_KEY=new_secret_456" in written_content
         assert "EXISTING_KEY=old_value" in written_content
     
-    def test_post_config_validates_and_filters_empty_values(self):
+    def test_post_config_validates_and_filters_empty_values(self, tmp_path):
         """D3: POST /config validates and filters empty values"""
         client = TestClient(app)
         
@@ -359,11 +355,7 @@ POLYGON_API_KEY=test_polygon_789
             "ANOTHER_VALID_KEY": "another_value"
         }
         
-        with patch('StrateQueue.api.daemon.CRED_FILE') as mock_cred_file:
-            mock_cred_file.exists.return_value = False
-            mock_cred_file.parent.mkdir = Mock()
-            mock_cred_file.write_text = Mock()
-            
+        with patch('StrateQueue.api.daemon.CRED_FILE', tmp_path / "credentials.env"):
             response = client.post("/config", json=payload)
             
             assert response.status_code == 200
@@ -400,6 +392,53 @@ POLYGON_API_KEY=test_polygon_789
         assert response.status_code == 400
         assert "No valid configuration provided" in response.json()["detail"]
 
+    def test_config_reads_are_cached_until_file_changes(self, tmp_path):
+        """D5: GET /config reparses credentials only when the file changes"""
+        cred_file = tmp_path / "credentials.env"
+        cred_file.write_text("ALPACA_API_KEY=first\n")
+        client = TestClient(app)
+        
+        with patch('StrateQueue.api.daemon.CRED_FILE', cred_file), \
+             patch.object(Path, 'read_text', autospec=True, side_effect=Path.read_text) as mock_read:
+            assert client.get("/config").json() == {"ALPACA_API_KEY": "first"}
+            assert client.get("/config").json() == {"ALPACA_API_KEY": "first"}
+            assert mock_read.call_count == 1
+            
+            cred_file.write_text("ALPACA_API_KEY=second_value\n")
+            assert client.get("/config").json() == {"ALPACA_API_KEY": "second_value"}
+            assert mock_read.call_count == 2
+
+    def test_post_config_replaces_credentials_file_atomically(self, tmp_path):
+        """D6: POST /config swaps in a complete, private credentials file"""
+        cred_file = tmp_path / "credentials.env"
+        cred_file.write_text("EXISTING_KEY=old_value\n")
+        client = TestClient(app)
+
+        with patch('StrateQueue.api.daemon.CRED_FILE', cred_file):
+            response = client.post("/config", json={"ALPACA_API_KEY": "new_key"})
+
+        assert response.status_code == 200
+        content = cred_file.read_text()
+        assert "EXISTING_KEY=old_value" in content
+        assert "ALPACA_API_KEY=new_key" in content
+        assert list(tmp_path.iterdir()) == [cred_file]
+        if os.name != "nt":
+            assert cred_file.stat().st_mode & 0o777 == 0o600
+
+    def test_post_config_failed_write_leaves_no_temp_file(self, tmp_path):
+        """D7: POST /config leaves no temp file behind when the write fails"""
+        cred_file = tmp_path / "credentials.env"
+        cred_file.write_text("EXISTING_KEY=old_value\n")
+        client = TestClient(app, raise_server_exceptions=False)
+
+        with patch('StrateQueue.api.daemon.CRED_FILE', cred_file), \
+             patch('StrateQueue.api.daemon.os.fsync', side_effect=OSError("disk full")):
+            response = client.post("/config", json={"ALPACA_API_KEY": "new_key"})
+
+        assert response.status_code == 500
+        assert list(tmp_path.iterdir()) == [cred_file]
+        assert cred_file.read_text() == "EXISTING_KEY=old_value\n"
+
 
 class TestFileUpload:
     """Test file upload endpoint."""
@@ -477,6 +516,45 @@ class TestFileUpload:
             # Original file should remain unchanged
             assert existing_file.read_text() == "# Existing strategy"
     
+    @patch('StrateQueue.api.daemon.Path.home')
+    def test_upload_strategy_skips_all_taken_suffixes(self, mock_home):
+        """E2: POST /upload_strategy picks the first free numbered suffix"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            upload_dir = Path(temp_dir) / ".stratequeue" / "uploaded_strategies"
+            upload_dir.mkdir(parents=True, exist_ok=True)
+            mock_home.return_value = Path(temp_dir)
+
+            for name in ("strategy.py", "strategy_1.py", "strategy_2.py"):
+                (upload_dir / name).write_text(f"# {name}")
+
+            client = TestClient(app)
+            response = client.post(
+                "/upload_strategy",
+                files={"file": ("strategy.py", "# New strategy file", "text/plain")}
+            )
+
+            assert response.status_code == 200
+            assert Path(response.json()["path"]).name == "strategy_3.py"
+            assert (upload_dir / "strategy_1.py").read_text() == "# strategy_1.py"
+
+    @patch('StrateQueue.api.daemon.Path.home')
+    def test_upload_strategy_creates_missing_directory(self, mock_home):
+        """E1: POST /upload_strategy creates the upload directory on first use"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            mock_home.return_value = Path(temp_dir)
+
+            client = TestClient(app)
+            response = client.post(
+                "/upload_strategy",
+                files={"file": ("first.py", "# First upload", "text/plain")}
+            )
+
+            assert response.status_code == 200
+            saved_path = Path(response.json()["path"])
+            upload_dir = Path(temp_dir) / ".stratequeue" / "uploaded_strategies"
+            assert saved_path.parent.resolve() == upload_dir.resolve()
+            assert saved_path.read_text() == "# First upload"
+
     @patch('StrateQueue.api.daemon.Path.home')
     def test_upload_strategy_handles_missing_filename(self, mock_home):
         """E3: POST /upload_strategy handles missing filenames gracefully"""
@@ -916,9 +994,10 @@ class TestStrategyManagement:
         # Status should be updated to finished
         assert data["status"] == "finished"
     
-    @patch('StrateQueue.api.daemon.httpx.get')
-    def test_get_strategy_statistics_returns_stats_structure(self, mock_httpx_get):
+    @patch('StrateQueue.api.daemon._stats_client')
+    def test_get_strategy_statistics_returns_stats_structure(self, mock_stats_client):
         """G3: GET /strategies/{id}/statistics returns statistics with correct structure"""
+        mock_httpx_get = mock_stats_client.return_value.get
         # Mock successful stats fetch
         mock_response = Mock()
         mock_response.status_code = 200
@@ -954,9 +1033,10 @@ class TestStrategyManagement:
         # Verify httpx was called
         mock_httpx_get.assert_called_once_with("http://127.0.0.1:8001/stats", timeout=2.0)
     
-    @patch('StrateQueue.api.daemon.httpx.get')
-    def test_get_strategy_statistics_handles_stats_fetch_failure(self, mock_httpx_get):
+    @patch('StrateQueue.api.daemon._stats_client')
+    def test_get_strategy_statistics_handles_stats_fetch_failure(self, mock_stats_client):
         """G3: GET /strategies/{id}/statistics handles stats URL fetch errors gracefully"""
+        mock_httpx_get = mock_stats_client.return_value.get
         # Mock failed stats fetch
         mock_httpx_get.side_effect = Exception("Connection timeout")
         
@@ -1189,6 +1269,34 @@ class TestBackgroundProcessMonitoring:
         assert meta["last_signal_type"] == "SELL"  # Should be the last signal processed
         assert meta["status"] == "finished"  # Should be marked as finished
     
+    @pytest.mark.asyncio
+    async def test_monitor_strategy_output_survives_oversized_line(self):
+        """H3b: a line over the stream limit is skipped and monitoring continues"""
+        job_id = str(uuid.uuid4())
+        reader = asyncio.StreamReader(limit=64)
+        reader.feed_data(b"x" * 200 + b"\n")
+        reader.feed_data(b"Extracted signal: BUY for AAPL\n")
+        reader.feed_eof()
+        
+        mock_proc = AsyncMock()
+        mock_proc.stdout = reader
+        mock_proc.returncode = None
+        
+        async def _wait():
+            mock_proc.returncode = 0
+        mock_proc.wait.side_effect = _wait
+        
+        running_systems[job_id] = {
+            "proc": mock_proc,
+            "meta": {"id": job_id, "status": "running", "last_signal": None, "last_signal_type": None},
+        }
+        
+        await monitor_strategy_output(job_id, mock_proc)
+        
+        meta = running_systems[job_id]["meta"]
+        assert meta["last_signal_type"] == "BUY"
+        assert meta["status"] == "finished"
+    
     @pytest.mark.asyncio
     async def test_monitor_strategy_output_handles_trade_executions(self):
         """H4: monitor_strategy_output updates metadata when trade executions are detected"""
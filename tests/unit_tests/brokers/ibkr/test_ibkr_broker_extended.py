@@ -4,6 +4,7 @@ Extra coverage for IBKRBroker:
 • limit order branch (with explicit price)
 • cancel_all_orders() & replace_order() helpers
 • error path when not connected
+• close_all_positions() batches close orders and survives a failed placement
 """
 
 from __future__ import annotations
@@ -152,4 +153,68 @@ def test_execute_signal_not_connected():
     res = br.execute_signal("AAPL", sig)
 
     assert res.success is False
-    assert "not connected" in res.message.lower() 
\ No newline at end of file
+    assert "not connected" in res.message.lower() 
+
+# -------------------------------------------------------------------------------------------
+# close_all_positions() places every close order before a single IB wait
+# -------------------------------------------------------------------------------------------
+def _patch_positions(monkeypatch, ib, holdings):
+    ib_positions = [
+        SimpleNamespace(
+            contract=SimpleNamespace(symbol=symbol), position=qty,
+            marketPrice=0.0, unrealizedPNL=0.0, avgCost=0.0,
+        )
+        for symbol, qty in holdings
+    ]
+    monkeypatch.setattr(ib, "positions", MagicMock(return_value=ib_positions), raising=False)
+
+
+def test_close_all_positions_batches_orders(monkeypatch):
+    br = _make_broker()
+    pm = br.position_manager
+    ib = pm.ib
+    _patch_positions(monkeypatch, ib, (("AAPL", 10), ("MSFT", -5)))
+
+    # Orders start PendingSubmit; one IB update submits the whole batch
+    place = ib.placeOrder
+
+    def _pending_place(contract, order):
+        trade = place(contract, order)
+        trade.orderStatus.status = "PendingSubmit"
+        return trade
+
+    def _submit_all(*_a, **_kw):
+        for trade in ib.trades():
+            trade.orderStatus.status = "Submitted"
+
+    monkeypatch.setattr(ib, "placeOrder", _pending_place, raising=False)
+    wait = MagicMock(side_effect=_submit_all)
+    monkeypatch.setattr(ib, "waitOnUpdate", wait, raising=False)
+
+    assert pm.close_all_positions() is True
+
+    ib.positions.assert_called_once()
+    wait.assert_called_once()
+    actions = {t.order.action: t.order.totalQuantity for t in ib.trades()[-2:]}
+    assert actions == {"SELL": 10, "BUY": 5}
+
+
+def test_close_all_positions_continues_after_failed_placement(monkeypatch):
+    br = _make_broker()
+    pm = br.position_manager
+    ib = pm.ib
+    _patch_positions(monkeypatch, ib, (("AAPL", 10), ("BAD", 3), ("MSFT", -5)))
+
+    place = ib.placeOrder
+    placed = []
+
+    def _place(contract, order):
+        if contract.symbol == "BAD":
+            raise RuntimeError("contract rejected")
+        placed.append(contract.symbol)
+        return place(contract, order)
+
+    monkeypatch.setattr(ib, "placeOrder", _place, raising=False)
+
+    assert pm.close_all_positions() is False
+    assert placed == ["AAPL", "MSFT"]
@@ -0,0 +1,108 @@
+"""
+Deploy Utilities Tests for StrateQueue CLI
+
+Tests the pure helper functions in cli/utils/deploy_utils.py covering:
+- Allocation parsing and validation in a single pass
+- Error messages for malformed, non-positive and mixed allocations
+- Inline multi-strategy config generation
+- Comma-separated and symbol list tokenizing
+
+Requirements for passing tests:
+1. All tests must run in milliseconds (no external processes, network, or file I/O)
+2. Verify parsed values and error messages together
+"""
+
+from argparse import Namespace
+
+import pytest
+
+from StrateQueue.cli.utils.deploy_utils import (
+    create_inline_strategy_config,
+    parse_allocation_values,
+    parse_comma_separated,
+    parse_symbols,
+    validate_allocation_values,
+)
+
+
+class TestParseAllocationValues:
+    """Test single-pass allocation parsing and validation"""
+
+    def test_percentage_allocations(self):
+        values, errors = parse_allocation_values(["0.4", "0.35", "0.25"])
+
+        assert values == [0.4, 0.35, 0.25]
+        assert errors == []
+
+    def test_dollar_allocations(self):
+        values, errors = parse_allocation_values(["25000", "10000"])
+
+        assert values == [25000.0, 10000.0]
+        assert errors == []
+
+    def test_empty_allocations(self):
+        assert parse_allocation_values([]) == ([], [])
+
+    def test_invalid_value_reported_and_skipped(self):
+        values, errors = parse_allocation_values(["0.5", "abc"])
+
+        assert values == [0.5]
+        assert errors == ["Invalid allocation value: abc. Must be a number."]
+
+    def test_non_positive_value(self):
+        _, errors = parse_allocation_values(["0.5", "-0.1"])
+
+        assert errors == ["Allocation 2 must be positive, got -0.1"]
+
+    def test_mixed_allocation_types(self):
+        _, errors = parse_allocation_values(["0.5", "1000"])
+
+        assert any("Cannot mix percentage" in e for e in errors)
+
+    @pytest.mark.parametrize(
+        "allocations, fragment",
+        [
+            (["0.6", "0.6"], "exceeds 100%"),
+            (["0.001", "0.002"], "too small"),
+        ],
+    )
+    def test_percentage_total_bounds(self, allocations, fragment):
+        _, errors = parse_allocation_values(allocations)
+
+        assert len(errors) == 1
+        assert fragment in errors[0]
+
+    def test_validate_allocation_values_returns_errors_only(self):
+        assert validate_allocation_values(["0.5", "0.5"]) == []
+        assert validate_allocation_values(["x"]) == [
+            "Invalid allocation value: x. Must be a number."
+        ]
+
+
+class TestCreateInlineStrategyConfig:
+    """Test inline multi-strategy config generation"""
+
+    def test_reuses_symbols_parsed_by_validator(self):
+        args = Namespace(
+            symbol="ignored",
+            _symbols=["AAPL", "MSFT"],
+            _strategies=["sma.py", "rsi.py"],
+            _allocations=["0.5", "0.5"],
+            _strategy_ids=["sma", "rsi"],
+        )
+
+        config = create_inline_strategy_config(args)
+
+        assert "sma.py,sma,0.5,AAPL" in config
+        assert "rsi.py,rsi,0.5,MSFT" in config
+
+
+class TestCommaSeparatedParsing:
+    """Test comma-separated argument tokenizing"""
+
+    def test_parse_comma_separated_strips_and_drops_empty(self):
+        assert parse_comma_separated(" sma.py, ,rsi.py ,") == ["sma.py", "rsi.py"]
+        assert parse_comma_separated("") == []
+
+    def test_parse_symbols_uppercases(self):
+        assert parse_symbols("aapl, msft ,,goog") == ["AAPL", "MSFT", "GOOG"]
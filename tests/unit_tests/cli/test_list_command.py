@@ -237,6 +237,26 @@ class TestListCommandExecution:
         assert "Available options: brokers, providers, engines" in captured.out
 
 
+    @patch('StrateQueue.cli.commands.list_command.InfoFormatter.format_broker_info')
+    def test_list_brokers_output_is_cached(self, mock_format_brokers, capsys):
+        """
+        Repeated `list brokers` calls in one process render broker info once
+
+        Requirements:
+        - InfoFormatter.format_broker_info called exactly once across runs
+        - Every run still prints the broker info
+        """
+        mock_format_brokers.return_value = "Cached broker information"
+        args = Namespace(list_type="brokers")
+
+        assert ListCommand().execute(args) == 0
+        assert ListCommand().execute(args) == 0
+
+        mock_format_brokers.assert_called_once()
+        captured = capsys.readouterr()
+        assert captured.out.count("Cached broker information") == 2
+
+
 class TestListCommandAliases:
     """Test list command aliases functionality"""
 
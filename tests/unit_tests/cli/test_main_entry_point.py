@@ -23,7 +23,16 @@ from unittest.mock import Mock, patch
 import sys
 from io import StringIO
 
-from StrateQueue.cli.cli import main, create_main_parser, show_welcome_message
+from StrateQueue.cli.cli import main, create_main_parser, show_welcome_message, _build_main_parser
+from StrateQueue.cli.command_factory import get_supported_commands
+
+
+@pytest.fixture(autouse=True)
+def _fresh_parser_cache():
+    """Parsers are cached per process; drop ones built with patched commands"""
+    _build_main_parser.cache_clear()
+    yield
+    _build_main_parser.cache_clear()
 
 
 class TestMainEntryPoint:
@@ -243,6 +252,76 @@ class TestMainParserCreation:
         args = parser.parse_args([])
         assert args.verbose == 0
 
+    @staticmethod
+    def _subparser_choices(parser):
+        return parser._subparsers._group_actions[0].choices
+
+    def test_only_selected_command_parser_is_built(self):
+        """
+        Test that naming a command builds only that command's subparser
+        
+        Requirements:
+        - Selected command (by name or alias) is registered and parses
+        - Other commands are not built
+        - Without a command, every subparser is registered
+        """
+        parser = create_main_parser(['--verbose', '1', 'ls', 'brokers'])
+        
+        assert set(self._subparser_choices(parser)) == {'list', 'ls'}
+        args = parser.parse_args(['--verbose', '1', 'ls', 'brokers'])
+        assert args.list_type == 'brokers'
+        
+        all_choices = self._subparser_choices(create_main_parser())
+        assert {'list', 'deploy', 'status', 'setup'} <= set(all_choices)
+
+    def test_parser_is_reused_for_same_command(self):
+        """
+        Test that repeated invocations reuse the cached parser
+        
+        Requirements:
+        - Same selected command returns the same parser instance
+        - A different command gets its own parser
+        """
+        parser = create_main_parser(['list', 'brokers'])
+        
+        assert create_main_parser(['-v', '1', 'list', 'engines']) is parser
+        assert create_main_parser(['status']) is not parser
+
+    def test_parser_cache_tracks_registered_commands(self):
+        """
+        Test that registering a command after the first parse rebuilds the parser
+        
+        Requirements:
+        - The top-level help epilog lists commands registered later
+        """
+        parser = create_main_parser()
+        commands = {**get_supported_commands(), 'backfill': 'Backfill historical bars'}
+        
+        with patch('StrateQueue.cli.cli.get_supported_commands', return_value=commands):
+            rebuilt = create_main_parser()
+        
+        assert rebuilt is not parser
+        assert 'backfill' in rebuilt.epilog
+        assert 'backfill' not in parser.epilog
+
+    def test_mistyped_command_builds_full_parser(self, capsys):
+        """
+        Test that a typo in the command position is not masked by later tokens
+        
+        Requirements:
+        - A command name appearing later in argv is not picked as the command
+        - The error lists every valid command, not just the later token's
+        """
+        parser = create_main_parser(['deplyo', '--strategy', 'x.py', '--broker', 'list'])
+        
+        assert {'list', 'deploy', 'status', 'setup'} <= set(self._subparser_choices(parser))
+        with pytest.raises(SystemExit):
+            parser.parse_args(['deplyo', 'list'])
+        
+        err = capsys.readouterr().err
+        assert "invalid choice: 'deplyo'" in err
+        assert "deploy" in err
+
 
 class TestWelcomeMessage:
     """Test the welcome message functionality"""
@@ -12,11 +12,13 @@ Requirements for passing tests:
 8. Test documentation paths that don't require questionary
 """
 
+import sys
+
 import pytest
 from unittest.mock import Mock, patch
 from argparse import Namespace
 
-from StrateQueue.cli.commands.setup_command import SetupCommand
+from StrateQueue.cli.commands.setup_command import SetupCommand, select
 
 
 class TestSetupCommandBasics:
@@ -58,6 +60,14 @@ class TestSetupCommandValidation:
         assert len(result) == 1
         assert "questionary" in result[0].lower()
 
+    def test_broken_questionary_install_cancels_prompt(self, capsys):
+        """A questionary that is found but fails to import reports it instead of raising"""
+        with patch.dict(sys.modules, {"questionary": None}):
+            answer = select("Select broker to configure:", choices=["alpaca"]).ask()
+        
+        assert answer is None
+        assert "requires 'questionary' package" in capsys.readouterr().out
+
 
 class TestSetupCommandDocumentationPaths:
     """Test setup command documentation paths (non-interactive)"""
@@ -128,3 +138,38 @@ class TestSetupCommandAliases:
         
         captured = capsys.readouterr()
         assert "Broker setup docs via configure alias" in captured.out
+
+
+class TestSetupCommandInteractiveDispatch:
+    """Test table-driven broker/provider menus and dispatch"""
+
+    @patch('StrateQueue.cli.commands.setup_command.SetupCommand._setup_ibkr', return_value="ibkr")
+    @patch('StrateQueue.cli.commands.setup_command.select')
+    @patch('StrateQueue.brokers.get_supported_brokers')
+    def test_broker_menu_dedupes_aliases_and_dispatches(self, mock_brokers, mock_select, mock_setup_ibkr):
+        """Broker aliases collapse to one menu entry and the chosen setup runs"""
+        mock_brokers.return_value = {"ibkr": "", "ib_gateway": "", "alpaca": "", "ccxt.binance": ""}
+        mock_select.return_value.ask.return_value = "Interactive Brokers (stocks, options, futures, forex)"
+
+        result = SetupCommand()._interactive_broker_setup()
+
+        assert result == "ibkr"
+        choices = mock_select.call_args.kwargs["choices"]
+        assert choices == [
+            "Alpaca (US stocks, ETFs, crypto)",
+            "Interactive Brokers (stocks, options, futures, forex)",
+        ]
+        mock_setup_ibkr.assert_called_once()
+
+    @patch('StrateQueue.cli.commands.setup_command.select')
+    @patch('StrateQueue.data.get_supported_providers')
+    def test_provider_menu_skips_demo_and_exchange_aliases(self, mock_providers, mock_select):
+        """Only providers with a setup flow are offered"""
+        mock_providers.return_value = ["demo", "polygon", "ccxt", "ccxt.binance"]
+        mock_select.return_value.ask.return_value = None
+
+        assert SetupCommand()._interactive_data_provider_setup() is None
+        assert mock_select.call_args.kwargs["choices"] == [
+            "Polygon (stocks, crypto, forex - premium)",
+            "CCXT (250+ cryptocurrency exchanges)",
+        ]
@@ -244,5 +244,17 @@ def test_get_metric_by_name():
             assert all_metrics["max_drawdown"] <= 0.0
 
 
+def test_enhanced_summary_computes_metrics_once():
+    """
+    Test that display_enhanced_summary renders both metric panels from a single metrics pass.
+    """
+    stats = StatisticsManager(initial_cash=10000.0)
+
+    with patch.object(StatisticsManager, 'calc_summary_metrics', wraps=stats.calc_summary_metrics) as mock_calc:
+        stats.display_enhanced_summary()
+
+    assert mock_calc.call_count == 1
+
+
 if __name__ == "__main__":
     pytest.main(["-v", __file__]) 
\ No newline at end of file
@@ -177,6 +177,14 @@ def test_rebalance_allocations_sum_gt_100_rolls_back(pm: SimplePortfolioManager)
     } == original
 
 
+def test_rebalance_allocations_exact_100_with_float_noise():
+    manager = SimplePortfolioManager({"s1": 0.25, "s2": 0.25, "s3": 0.25, "s4": 0.25})
+
+    # Naive sum() of these is 1.0000000000000002
+    assert manager.rebalance_allocations({"s1": 0.05, "s2": 0.55, "s3": 0.3, "s4": 0.1})
+    assert manager.strategy_allocations["s2"].allocation_percentage == pytest.approx(0.55)
+
+
 # ---------------------------------------------------------------------------
 # Allow direct execution: `python test_portfolio_manager.py`
 # ---------------------------------------------------------------------------
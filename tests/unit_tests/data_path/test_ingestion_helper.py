@@ -14,14 +14,21 @@ These tests validate the high-level helper `setup_data_ingestion` defined in
    • Historical data is fetched for every requested symbol.
 
 The helper must raise `ValueError` when given an unrecognised `data_source`.
+
+4. **MinimalSignalGenerator**
+   • Price history is bounded to the long window and the incremental
+     moving-average sums match a full recomputation.
 A test run passes when every assertion below succeeds.
 """
 
 from __future__ import annotations
 
+from datetime import datetime
+
 import pytest
 
-from StrateQueue.data.ingestion import IngestionInit, setup_data_ingestion
+from StrateQueue.data.ingestion import IngestionInit, MinimalSignalGenerator, setup_data_ingestion
+from StrateQueue.data.sources import MarketData
 
 SYMBOLS = ["AAPL", "MSFT"]
 
@@ -81,4 +88,26 @@ def test_full_mode_fetches_history():
 
 def test_unknown_data_source_raises():
     with pytest.raises(ValueError):
-        setup_data_ingestion("not_a_real_source", SYMBOLS) 
\ No newline at end of file
+        setup_data_ingestion("not_a_real_source", SYMBOLS) 
+
+
+# ---------------------------------------------------------------------------
+# MinimalSignalGenerator rolling windows
+# ---------------------------------------------------------------------------
+
+def test_signal_generator_keeps_rolling_sums_in_step():
+    provider = setup_data_ingestion("demo", SYMBOLS, mode=IngestionInit.CONSTRUCT)
+    generator = MinimalSignalGenerator(provider)
+
+    for i in range(45):
+        price = 100.0 + (i % 7) * 1.5
+        generator.on_new_data(
+            MarketData("AAPL", datetime.now(), price, price, price, price, 100)
+        )
+
+    history = list(generator.price_history["AAPL"])
+    assert len(history) == generator.long_window
+    assert generator._long_sum["AAPL"] == pytest.approx(sum(history))
+    assert generator._short_sum["AAPL"] == pytest.approx(
+        sum(history[-generator.short_window:])
+    )
@@ -128,6 +128,23 @@ async def test_multi_ticker_cycle(multi_ticker_tp: TradingProcessor):
     assert multi_ticker_tp.multi_ticker_extractor.calls == 1
 
 
+@pytest.mark.asyncio
+async def test_multi_ticker_warmup_logs_once_per_cycle(multi_ticker_tp: TradingProcessor, caplog):
+    dm_stub = _StubDataManager()
+    dm_stub._df = pd.DataFrame({"Close": [1.0] * 3})  # below lookback_period=5
+
+    import logging
+
+    with caplog.at_level(logging.INFO, logger="StrateQueue.live_system.trading_processor"):
+        res = await multi_ticker_tp.process_trading_cycle(dm_stub)
+
+    assert res == {}
+    assert multi_ticker_tp.multi_ticker_extractor.calls == 0
+    building = [r.getMessage() for r in caplog.records if "Building" in r.getMessage()]
+    assert len(building) == 1
+    assert "AAPL" in building[0] and "MSFT" in building[0]
+
+
 # ---------------------------------------------------------------------------
 # Constructor attribute checks
 # ---------------------------------------------------------------------------
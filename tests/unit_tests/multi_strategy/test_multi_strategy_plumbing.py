@@ -289,4 +289,47 @@ def test_rebalance_updates_allocations(runner: MultiStrategyRunner):
 
     pm = runner.portfolio_integrator.portfolio_manager
     assert pm.strategy_allocations["strat_a"].allocation_percentage == pytest.approx(0.7)
-    assert pm.strategy_allocations["strat_b"].allocation_percentage == pytest.approx(0.3)
\ No newline at end of file
+    assert pm.strategy_allocations["strat_b"].allocation_percentage == pytest.approx(0.3)
+
+# ---------------------------------------------------------------------------
+# 7. Status summary text
+# ---------------------------------------------------------------------------
+def test_strategy_status_summary_blocks(runner: MultiStrategyRunner):
+    summary = runner.get_strategy_status_summary()
+
+    assert summary.startswith("=" * 60 + "\nMULTI-STRATEGY PORTFOLIO STATUS\n")
+    assert (
+        "Active Positions: 0\n\n"
+        "Strategy: strat_a (50.0%)\n"
+        "  Allocated: $5,000.00\n"
+        "  Available: $5,000.00\n"
+        "  Positions: 0 ()\n\n"
+        "Strategy: strat_b (30.0%)\n"
+    ) in summary
+    assert summary.endswith("  Positions: 0 ()\n")
+
+# ---------------------------------------------------------------------------
+# 8. Signal generation yields to the event loop between strategies
+# ---------------------------------------------------------------------------
+def test_generate_signals_yields_between_strategies(runner: MultiStrategyRunner, _ohlcv):
+    import asyncio
+
+    ticks: list[int] = []
+
+    async def _ticker():
+        while True:
+            ticks.append(len(ticks))
+            await asyncio.sleep(0)
+
+    async def _run():
+        task = asyncio.create_task(_ticker())
+        await asyncio.sleep(0)  # let the ticker start
+        started = len(ticks)
+        signals = await runner.generate_signals("AAPL", _ohlcv)
+        task.cancel()
+        return signals, len(ticks) - started
+
+    signals, ticks_during = asyncio.run(_run())
+
+    assert set(signals) == {"strat_a", "strat_b"}
+    assert ticks_during >= 2, "other tasks should run between strategy extractions"